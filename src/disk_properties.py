@@ -16,6 +16,34 @@ import shlex
 from pathlib import Path
 
 
+# udevデータベースのディレクトリ
+UDEV_DATA_DIR = "/run/udev/data"
+
+# sysfsのブロックデバイスのディレクトリ
+SYSFS_BLOCK_DIR = "/sys/class/block"
+
+# DEVTYPEがdiskでも、lsblkでは別の種別（lvm, crypt, loop, raid）になるデバイスが持つsysfsのディレクトリ
+SYSFS_STACKED_DEVICE_DIRS = ("dm", "loop", "md")
+
+# udevがエスケープしたバイト（\xNN）
+UDEV_ESCAPE_PATTERN = re.compile(rb"\\x([0-9a-fA-F]{2})")
+
+# lsblkと同じ表記でサイズを表すための単位
+SIZE_UNITS = ("B", "K", "M", "G", "T", "P", "E")
+
+# smartctlの出力を解析する正規表現（モジュールの読み込み時に一度だけコンパイルする）
+SMART_HEALTH_PATTERN = re.compile(r"SMART overall-health self-assessment test result: (\w+)")
+SMART_TEMPERATURE_PATTERN = re.compile(r"Temperature.*?(\d+)")
+SMART_POWER_ON_HOURS_PATTERN = re.compile(r"Power_On_Hours.*?(\d+)")
+SMART_RECENT_ERROR_PATTERN = re.compile(r"Error \d+ occurred at.*?(\d{4}-\d{2}-\d{2})")
+# SATA PHYイベントカウンタ（正規表現, 結果のキー）
+SATA_PHY_EVENT_PATTERNS = (
+    (re.compile(r"CRC Error Count.*?(\d+)"), "CRC_Error_Count"),
+    (re.compile(r"Illegal State.*?(\d+)"), "Illegal_State"),
+    (re.compile(r"R_ERR response.*?(\d+)"), "R_ERR_Response"),
+)
+
+
 class DiskPropertiesAnalyzer:
     """
     ディスクプロパティ情報を解析するクラス
@@ -32,6 +60,10 @@ class DiskPropertiesAnalyzer:
         """
         self.logger = logger
         
+        # 基本情報のキャッシュ（デバイスパス -> (udevデータの更新時刻, 基本情報)）
+        # S.M.A.R.T.情報やファイルシステムの状態は変化するため、キャッシュしない
+        self._basic_info_cache = {}
+        
         # S.M.A.R.T.属性閾値定義
         self.smart_thresholds = {
             "Reallocated_Sector_Ct": {"normal": 0, "warning": 10, "critical": 10},
@@ -39,6 +71,12 @@ class DiskPropertiesAnalyzer:
             "Offline_Uncorrectable": {"normal": 0, "warning": 1, "critical": 1},
             "UDMA_CRC_Error_Count": {"normal": 0, "warning": 5, "critical": 5}
         }
+        
+        # 閾値を定義した属性の値を探す正規表現（呼び出しのたびに組み立てない）
+        self._smart_attr_patterns = [
+            (attr_name, re.compile(r"{}.*?(\d+)".format(attr_name.replace("_", " "))))
+            for attr_name in self.smart_thresholds
+        ]
 
     def get_disk_properties(self, device_path):
         """
@@ -54,7 +92,7 @@ class DiskPropertiesAnalyzer:
         
         try:
             # ディスクの基本情報を取得
-            basic_info = self._get_basic_disk_info(device_path)
+            basic_info = self.get_basic_disk_info(device_path)
             
             # パーティションかディスク全体かを判断
             is_partition = self._is_partition(device_path)
@@ -95,6 +133,29 @@ class DiskPropertiesAnalyzer:
             self.logger.error(f"プロパティ情報の取得中にエラーが発生しました: {str(e)}")
             return {"error": str(e)}
     
+    def get_basic_disk_info(self, device_path):
+        """
+        ディスクの基本情報を取得します（udevデータが更新されていなければ前回の結果を返します）
+        
+        udevデータベースとsysfsを読み取るだけで、smartctlやfsckは実行しません。
+        
+        Args:
+            device_path (str): ディスクデバイスのパス
+            
+        Returns:
+            dict: ディスクの基本情報
+        """
+        udev_mtime = self._get_udev_data_mtime(device_path)
+        cached = self._basic_info_cache.get(device_path)
+        if udev_mtime is not None and cached is not None and cached[0] == udev_mtime:
+            return cached[1]
+        
+        basic_info = self._get_basic_disk_info(device_path)
+        # 取得に失敗した（空の）結果はキャッシュしない
+        if udev_mtime is not None and basic_info:
+            self._basic_info_cache[device_path] = (udev_mtime, basic_info)
+        return basic_info
+    
     def _get_basic_disk_info(self, device_path):
         """
         ディスクの基本情報を取得します
@@ -108,6 +169,23 @@ class DiskPropertiesAnalyzer:
         try:
             result = {}
             
+            # udevデータベースとsysfsから直接読み取れる場合はサブプロセスを起動しない
+            # （種別をsysfsだけでは判別できないデバイスはlsblkで取得する）
+            udev_props = self._read_udev_properties(device_path)
+            if udev_props is not None:
+                name = os.path.basename(os.path.realpath(device_path))
+                device_type = self._read_sysfs_device_type(name)
+                if device_type is not None:
+                    return {
+                        "name": name,
+                        "size": self._read_sysfs_size(name),
+                        # lsblkと同様、モデル名はディスク全体についてのみ表示する
+                        "model": self._read_model(name, udev_props) if device_type == "disk" else "",
+                        "serial": udev_props.get("ID_SERIAL_SHORT", udev_props.get("ID_SERIAL", "")),
+                        "type": device_type,
+                        "fstype": udev_props.get("ID_FS_TYPE", "")
+                    }
+            
             # lsblkコマンドで基本情報を取得
             cmd = ["lsblk", "-o", "NAME,SIZE,MODEL,SERIAL,TYPE,FSTYPE", "-J", device_path]
             process = subprocess.run(cmd, capture_output=True, text=True, check=False)
@@ -131,6 +209,150 @@ class DiskPropertiesAnalyzer:
             self.logger.error(f"基本情報の取得中にエラーが発生しました: {str(e)}")
             return {}
     
+    def _get_udev_data_path(self, device_path):
+        """
+        デバイスに対応するudevデータベースのファイルパスを返します
+        
+        Args:
+            device_path (str): ディスクデバイスのパス
+            
+        Returns:
+            str: /run/udev/data/b<major>:<minor> のパス
+            
+        Raises:
+            OSError: デバイスノードを参照できない場合
+        """
+        rdev = os.stat(device_path).st_rdev
+        return os.path.join(UDEV_DATA_DIR, f"b{os.major(rdev)}:{os.minor(rdev)}")
+    
+    def _get_udev_data_mtime(self, device_path):
+        """
+        デバイスのudevデータベースの更新時刻を返します
+        
+        Args:
+            device_path (str): ディスクデバイスのパス
+            
+        Returns:
+            int: 更新時刻（ナノ秒）。取得できない場合はNone
+        """
+        try:
+            return os.stat(self._get_udev_data_path(device_path)).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _read_udev_properties(self, device_path):
+        """
+        udevデータベース（/run/udev/data/b<major>:<minor>）からデバイスのプロパティを読み取ります
+        
+        Args:
+            device_path (str): ディスクデバイスのパス
+            
+        Returns:
+            dict: プロパティ（E:KEY=VALUEの行）の辞書。読み取れない場合はNone
+        """
+        try:
+            with open(self._get_udev_data_path(device_path), encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        
+        return dict(
+            line[2:].split("=", 1)
+            for line in lines
+            if line.startswith("E:") and "=" in line
+        )
+    
+    def _read_sysfs_size(self, device_name):
+        """
+        sysfsからデバイスのサイズを読み取り、lsblkと同じ表記で返します
+        
+        Args:
+            device_name (str): デバイス名（例: sda1）
+            
+        Returns:
+            str: サイズ（例: 58.6G）。読み取れない場合は空文字列
+        """
+        try:
+            with open(os.path.join(SYSFS_BLOCK_DIR, device_name, "size")) as f:
+                # sysfsのサイズは常に512バイトのセクタ単位
+                size = int(f.read()) * 512
+        except (OSError, ValueError):
+            return ""
+        
+        value = float(size)
+        unit = 0
+        while value >= 1024 and unit < len(SIZE_UNITS) - 1:
+            value /= 1024
+            unit += 1
+        text = f"{value:.1f}".rstrip("0").rstrip(".")
+        return f"{text}{SIZE_UNITS[unit]}"
+    
+    def _read_sysfs_device_type(self, device_name):
+        """
+        sysfsのueventからデバイスの種別を読み取り、lsblkのTYPEと同じ表記で返します
+        
+        udevデータベースにはDEVTYPEが含まれないため、sysfsから読み取ります。
+        
+        Args:
+            device_name (str): デバイス名（例: sda1）
+            
+        Returns:
+            str: "disk" または "part"。lvm・crypt・loop・raid・romなど、
+                lsblkでないと判別できない種別の場合や読み取れない場合はNone
+        """
+        device_dir = os.path.join(SYSFS_BLOCK_DIR, device_name)
+        if any(os.path.exists(os.path.join(device_dir, sub)) for sub in SYSFS_STACKED_DEVICE_DIRS):
+            return None
+        
+        try:
+            with open(os.path.join(device_dir, "uevent")) as f:
+                uevent = dict(line.split("=", 1) for line in f.read().splitlines() if "=" in line)
+        except OSError:
+            return None
+        
+        devtype = uevent.get("DEVTYPE")
+        if devtype == "partition":
+            return "part"
+        if devtype != "disk":
+            return None
+        
+        # 光学ドライブ（SCSIのデバイス種別5）はlsblkではromになる
+        try:
+            with open(os.path.join(device_dir, "device", "type")) as f:
+                if f.read().strip() == "5":
+                    return None
+        except OSError:
+            pass
+        return "disk"
+    
+    def _read_model(self, device_name, udev_props):
+        """
+        ディスクのモデル名をlsblkと同じ表記（空白を含む）で返します
+        
+        udevのID_MODELは空白が「_」に置き換えられているため、
+        エスケープされたID_MODEL_ENCを復元し、なければsysfsのdevice/modelを読み取ります。
+        
+        Args:
+            device_name (str): デバイス名（例: sda）
+            udev_props (dict): udevデータベースのプロパティ
+            
+        Returns:
+            str: モデル名。取得できない場合は空文字列
+        """
+        encoded = udev_props.get("ID_MODEL_ENC")
+        if encoded:
+            # エスケープはUTF-8のバイト単位のため、バイト列に戻してからまとめて復号する
+            raw = UDEV_ESCAPE_PATTERN.sub(
+                lambda m: bytes((int(m.group(1), 16),)), encoded.encode("utf-8")
+            )
+            return raw.decode("utf-8", "replace").strip()
+        
+        try:
+            with open(os.path.join(SYSFS_BLOCK_DIR, device_name, "device", "model")) as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+    
     def _is_partition(self, device_path):
         """
         デバイスがパーティションかディスク全体かを判断します
@@ -192,7 +414,7 @@ class DiskPropertiesAnalyzer:
             
             # 全体的な健康状態を取得
             if "SMART overall-health self-assessment test result" in output:
-                match = re.search(r"SMART overall-health self-assessment test result: (\w+)", output)
+                match = SMART_HEALTH_PATTERN.search(output)
                 if match:
                     result["overall_health"] = match.group(1)
                     result["smart_supported"] = True
@@ -203,19 +425,18 @@ class DiskPropertiesAnalyzer:
                 return result
             
             # 重要な属性を取得
-            for attr_name in self.smart_thresholds:
-                pattern = r"{}.*?(\d+)".format(attr_name.replace("_", " "))
-                match = re.search(pattern, output)
+            for attr_name, pattern in self._smart_attr_patterns:
+                match = pattern.search(output)
                 if match:
                     result["attributes"][attr_name] = int(match.group(1))
             
             # 温度情報を取得
-            temp_match = re.search(r"Temperature.*?(\d+)", output)
+            temp_match = SMART_TEMPERATURE_PATTERN.search(output)
             if temp_match:
                 result["temperature"] = f"{temp_match.group(1)}°C"
             
             # 稼働時間を取得
-            hours_match = re.search(r"Power_On_Hours.*?(\d+)", output)
+            hours_match = SMART_POWER_ON_HOURS_PATTERN.search(output)
             if hours_match:
                 hours = int(hours_match.group(1))
                 days = hours // 24
@@ -230,7 +451,7 @@ class DiskPropertiesAnalyzer:
                 result["error_log_summary"] = "エラーなし"
             elif "SMART Error Log" in error_output:
                 error_count = error_output.count("Error ")
-                recent_error = re.search(r"Error \d+ occurred at.*?(\d{4}-\d{2}-\d{2})", error_output)
+                recent_error = SMART_RECENT_ERROR_PATTERN.search(error_output)
                 recent_date = recent_error.group(1) if recent_error else "不明"
                 result["error_log_summary"] = f"{error_count}個のエラー, 最新: {recent_date}"
             
@@ -241,14 +462,8 @@ class DiskPropertiesAnalyzer:
             
             # SATA PHYイベントカウンタなど
             sata_errors = {}
-            phy_event_patterns = [
-                (r"CRC Error Count.*?(\d+)", "CRC_Error_Count"),
-                (r"Illegal State.*?(\d+)", "Illegal_State"),
-                (r"R_ERR response.*?(\d+)", "R_ERR_Response")
-            ]
-            
-            for pattern, key in phy_event_patterns:
-                match = re.search(pattern, detailed_output)
+            for pattern, key in SATA_PHY_EVENT_PATTERNS:
+                match = pattern.search(detailed_output)
                 if match:
                     sata_errors[key] = int(match.group(1))
             
@@ -283,10 +498,14 @@ class DiskPropertiesAnalyzer:
                 "fsck_details": ""
             }
             
-            # ファイルシステムタイプを取得
-            cmd = ["lsblk", "-o", "FSTYPE", "-n", device_path]
-            process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            fstype = process.stdout.strip()
+            # ファイルシステムタイプを取得（udevデータベースを優先し、なければlsblk）
+            udev_props = self._read_udev_properties(device_path)
+            if udev_props is not None:
+                fstype = udev_props.get("ID_FS_TYPE", "")
+            else:
+                cmd = ["lsblk", "-o", "FSTYPE", "-n", device_path]
+                process = subprocess.run(cmd, capture_output=True, text=True, check=False)
+                fstype = process.stdout.strip()
             result["fstype"] = fstype if fstype else "未フォーマット"
             
             # ファイルシステムタイプがある場合のみfsckを実行
@@ -8,6 +8,8 @@ import json
 import os
 import re
 import shlex
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from src.config_manager import ConfigManager
 from typing import Tuple, List, Optional, Dict, Any, TypedDict, Union, cast
@@ -30,6 +32,47 @@ class DiskInfo(TypedDict, total=False):
     partuuid: Optional[str]  # パーティションUUID（オプション）
     partlabel: Optional[str]  # パーティションラベル（オプション）
 
+@dataclass(slots=True)
+class Disk:
+    """GUIのディスクリストに表示するディスク情報"""
+    name: str  # デバイス名
+    path: str  # デバイスパス
+    device: str  # デバイスパス（pathと同じ値）
+    size: str  # サイズ
+    type: str  # デバイスタイプ
+    fstype: str  # ファイルシステムタイプ（未フォーマットの場合は空文字列）
+    mountpoint: Optional[str] = None  # マウントポイント（未マウントの場合はNone）
+    display_text: str = field(init=False, repr=False, compare=False)  # リストに表示する文字列
+
+    def __post_init__(self) -> None:
+        """リストの表示文字列を作成時に一度だけ組み立てます。"""
+        self.display_text = (
+            f"{self.name} - {self.size} ({self.fstype})" if self.fstype
+            else f"{self.name} - {self.size}"
+        )
+
+    @classmethod
+    def from_lsblk(cls, data: Dict[str, Any]) -> "Disk":
+        """
+        lsblkのJSON出力の1デバイス分からDiskを作成します。
+
+        Args:
+            data (Dict[str, Any]): lsblkの出力から取得したデバイス情報
+
+        Returns:
+            Disk: 作成されたDisk
+        """
+        path = data.get("path") or f"/dev/{data['name']}"
+        return cls(
+            name=data["name"],
+            path=path,
+            device=path,
+            size=data.get("size") or "",
+            type=data.get("type") or "",
+            fstype=data.get("fstype") or "",
+            mountpoint=data.get("mountpoint")
+        )
+
 class UnmountedDisksResponse(TypedDict, total=False):
     """未マウントディスクのレスポンスを表す型"""
     blockdevices: List[DiskInfo]  # 未マウントディスクのリスト
@@ -130,6 +173,9 @@ class DiskUtils:
     """
     ディスク操作を行うクラス
     """
+    # ディスク構成の変化を判定できない場合に、get_all_disksの結果を再利用する秒数
+    DISK_CACHE_TTL = 2.0
+
     def __init__(self, logger: Logger, test_mode: bool = False):
         """
         初期化
@@ -141,6 +187,66 @@ class DiskUtils:
         self.logger = logger
         self.test_mode = test_mode
         self.allowed_fs_types = ["ntfs", "exfat", "refs"]
+        # get_all_disksの結果のキャッシュ（stampが変わらない間は再利用する）
+        self._disk_cache: Dict[str, Any] = {"all": None, "stamp": None, "time": 0.0}
+
+    def get_all_disks(self) -> Dict[str, Any]:
+        """
+        すべてのブロックデバイス情報を一度のlsblk呼び出しで取得します。
+
+        マウント済み・未マウントの振り分けは呼び出し側で行います。
+
+        Returns:
+            Dict[str, Any]: lsblkのJSON出力（子デバイスを含むツリー）
+
+        Raises:
+            RuntimeError: ディスク情報の取得に失敗した場合
+        """
+        stamp = self._get_disk_stamp()
+        if self._disk_cache["all"] is not None and self._disk_cache["stamp"] == stamp:
+            # 構成の変化を判定できない環境では、短い時間だけ結果を再利用する
+            if stamp is not None or time.monotonic() - self._disk_cache["time"] < self.DISK_CACHE_TTL:
+                return self._disk_cache["all"]
+
+        try:
+            self.logger.info("ディスク情報の取得を開始します")
+            result = subprocess.check_output(["lsblk", "-J", "-o", "NAME,PATH,SIZE,TYPE,MOUNTPOINT,MODEL,FSTYPE,SERIAL,UUID,LABEL,PARTUUID,PARTLABEL"]).decode()
+            data = json.loads(result)
+            self.logger.info(f"ディスク情報の取得が完了しました: {len(data.get('blockdevices', []))}個のデバイスが見つかりました")
+            self._disk_cache = {"all": data, "stamp": stamp, "time": time.monotonic()}
+            return data
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"ディスク情報の取得に失敗しました: {str(e)}")
+            raise RuntimeError(f"ディスク情報の取得に失敗しました: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"ディスク情報の取得に失敗しました: {str(e)}")
+            raise RuntimeError(f"ディスク情報の取得に失敗しました: {str(e)}")
+
+    def invalidate_cache(self) -> None:
+        """
+        get_all_disksのキャッシュを破棄します。
+
+        マウントやフォーマットなど、ディスクの状態を変更した後に呼び出します。
+        """
+        self._disk_cache = {"all": None, "stamp": None, "time": 0.0}
+
+    def _get_disk_stamp(self) -> Optional[Tuple[int, str]]:
+        """
+        ディスク構成が変化したかを判定するための値を取得します。
+
+        udevデータベースのディレクトリ（デバイスの追加・削除や属性の変化で
+        エントリが置き換えられる）の更新時刻と、マウント一覧の内容を組み合わせます。
+
+        Returns:
+            Optional[Tuple[int, str]]: 判定用の値。取得できない場合はNone（DISK_CACHE_TTLの間だけキャッシュする）
+        """
+        try:
+            udev_mtime = os.stat("/run/udev/data").st_mtime_ns
+            with open("/proc/self/mounts", encoding="utf-8", errors="replace") as f:
+                mounts = f.read()
+        except OSError:
+            return None
+        return udev_mtime, mounts
 
     def get_unmounted_disks(self) -> Dict[str, List[DiskInfo]]:
         """
@@ -422,7 +528,7 @@ class DiskUtils:
             command = ["open" if sys.platform == "darwin" else "xdg-open", path]
             process = subprocess.Popen(command)
             
-            # プロセスの終了を待つ
+            # プロセスの終了を待つ（ワーカースレッドから呼ばれるため、GUIは止まらない）
             process.wait(timeout=5)
             
             if process.returncode != 0:
@@ -436,6 +542,8 @@ class DiskUtils:
             
         except subprocess.TimeoutExpired:
             process.kill()
+            # 強制終了したプロセスを回収する
+            process.wait()
             error_msg = f"ファイルマネージャーの起動がタイムアウトしました: {path}"
             self.logger.error(error_msg)
             return False, error_msg
@@ -6,14 +6,282 @@
 """
 
 import os
-import re
-import stat
+import atexit
 import logging
-import logging.handlers
-import sys
-from typing import Optional, List
-from datetime import datetime
-from pathlib import Path
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, List
+
+# 共有ロガーの名前
+_LOGGER_NAME = 'disk_utility'
+
+# 共有ロガーの設定が済んでいるかどうか
+_LOGGER_CONFIGURED = False
+_CONFIGURE_LOCK = threading.Lock()
+
+# ログファイルごとに共有するライター（同じファイルを複数回開かない）
+_WRITERS: Dict[str, '_LogWriter'] = {}
+_WRITERS_LOCK = threading.Lock()
+
+# パスから除去する特殊文字（/ は保持）の変換テーブル
+_SANITIZE_TABLE = str.maketrans('', '', '<>:"|?*\\')
+
+# テスト用に保持するメッセージの最大件数
+_MESSAGE_BUFFER_SIZE = 1024
+
+# ログローテーションの設定
+_MAX_BYTES = 16 * 1024 * 1024  # 16MB
+_BACKUP_COUNT = 5
+
+# ログ行に埋め込むレベル名（エンコード済み）
+_LEVEL_BYTES = {
+    level: f" {level} ".encode('ascii')
+    for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+}
+
+# 書き込み待ちのログ行の最大数（超えた場合、呼び出し元は空きができるまで待つ）
+_QUEUE_MAX_SIZE = 4096
+
+# ライタースレッドが1回のシステムコールでまとめて書き込む最大行数
+_WRITE_BATCH_SIZE = 64
+
+# ライタースレッドにfsyncを要求するためにキューへ積む目印
+_SYNC = object()
+
+
+def _ts(_cache=[0, b'']) -> bytes:
+    """
+    秒単位でキャッシュしたタイムスタンプを返します。
+
+    同じ秒の間に書き込まれたログは、フォーマット・エンコード済みのバイト列を再利用します。
+
+    Returns:
+        bytes: '%Y-%m-%d %H:%M:%S' 形式のタイムスタンプ（ASCII）
+    """
+    now = int(time.time())
+    cache = _cache
+    if now != cache[0]:
+        cache[0] = now
+        cache[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)).encode('ascii')
+    return cache[1]
+
+def _recycle_log_file(path: str, backup_count: int) -> None:
+    """
+    ログファイルをバックアップ枠に移してローテーションします。
+
+    .1 から順に名前をずらすのではなく、空いている枠か最も古い枠を再利用するため、
+    ローテーション1回あたりのリネームは1回で済みます。
+
+    Args:
+        path (str): ログファイルのパス
+        backup_count (int): バックアップファイルの最大数
+    """
+    slot, oldest = 1, None
+    for i in range(1, backup_count + 1):
+        try:
+            mtime = os.stat(f"{path}.{i}").st_mtime
+        except FileNotFoundError:
+            slot = i
+            break
+        if oldest is None or mtime < oldest:
+            slot, oldest = i, mtime
+    os.replace(path, f"{path}.{slot}")
+
+class _LogWriter:
+    """
+    ログファイルへの書き込みをバックグラウンドスレッドで行うライター
+
+    呼び出し元はキューへの追加のみを行い、ディスクI/Oはライタースレッドが担当します。
+    """
+
+    def __init__(self, path: str):
+        """
+        初期化
+
+        Args:
+            path (str): ログファイルのパス
+        """
+        self.path = path
+        self._closed = False
+        self._refs = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=_QUEUE_MAX_SIZE)
+        # 閉じたかどうかの確認とキューへの追加を、closeの終了要求と不可分に行うためのロック
+        # （終了要求の後にログ行が積まれると、書き込まれず待ち続けることになる）
+        self._lock = threading.Lock()
+        
+        self._open()
+        
+        self._thread = threading.Thread(
+            target=self._run, name="disk_utility-log-writer", daemon=True
+        )
+        self._thread.start()
+        
+        # 終了時にキューに残ったログを書き出す
+        atexit.register(self.close)
+
+    def _open(self) -> None:
+        """
+        ログファイルを追記モードで開き、現在のサイズを記録します。
+        """
+        # ファイルを追記モードで開いたまま保持（存在しない場合は作成）
+        self._fd = os.open(self.path, os.O_CREAT | os.O_APPEND | os.O_WRONLY, 0o644)
+        
+        # ログファイルのパーミッションを設定（umaskで権限が削られる場合に備える）
+        os.fchmod(self._fd, 0o644)
+        
+        # 書き込みのたびにstatしないよう、サイズは書き込んだバイト数で追跡する
+        self._size = os.fstat(self._fd).st_size
+
+    def _rollover(self) -> None:
+        """
+        ログファイルをローテーションします（ライタースレッドから呼ばれる）。
+        """
+        os.close(self._fd)
+        try:
+            _recycle_log_file(self.path, _BACKUP_COUNT)
+        finally:
+            # リネームに失敗しても書き込みを継続できるよう必ず開き直す
+            self._open()
+
+    def write(self, data: bytes) -> None:
+        """
+        ログ行を書き込みキューに追加します。
+
+        Args:
+            data (bytes): 書き込むログ行
+
+        Raises:
+            ValueError: ライターが既に閉じられている場合
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError("ログファイルは既に閉じられています")
+            self._queue.put(data)
+
+    def flush(self, sync: bool = False) -> None:
+        """
+        キューに追加済みのログがすべて書き込まれるまで待機します。
+
+        Args:
+            sync (bool): Trueの場合、書き込んだ内容をfsyncでディスクに反映させてから戻る
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if sync:
+                self._queue.put(_SYNC)
+        # 終了要求より前に積まれたものはすべてライタースレッドが処理するため、
+        # 待機中にcloseされても戻ってくる
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        キューに残ったログを書き出してからファイルを閉じます。
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        os.close(self._fd)
+        atexit.unregister(self.close)
+
+    def _write_batch(self, lines: List[bytes]) -> None:
+        """
+        複数のログ行を1回のシステムコールで書き込みます。
+
+        Args:
+            lines (List[bytes]): 書き込むログ行のリスト
+        """
+        # 追記モードのため、まとめて書き込んでも行が他の書き込みと混ざらない
+        if hasattr(os, 'writev'):
+            os.writev(self._fd, lines)
+        else:
+            os.write(self._fd, b''.join(lines))
+
+    def _run(self) -> None:
+        """
+        キューからログ行を取り出して書き込むスレッド本体
+
+        キューに溜まっているログ行は最大_WRITE_BATCH_SIZE行までまとめて書き込み、
+        fsyncは毎回は行わず、flush(sync=True)で要求された場合のみ行います。
+        """
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < _WRITE_BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # 終了要求（None）はcloseと競合したwriteの後ろに積まれるとは限らないため、
+            # fsync要求と同様に位置によらず取り除く
+            lines = []
+            stop = sync = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif item is _SYNC:
+                    sync = True
+                else:
+                    lines.append(item)
+            try:
+                if lines:
+                    self._write_batch(lines)
+                    self._size += sum(map(len, lines))
+                    # ローテーションもライタースレッドで行い、呼び出し元を待たせない
+                    if self._size >= _MAX_BYTES:
+                        self._rollover()
+                # USBメディアへの負荷を抑えるため、fsyncは要求された場合のみ行う
+                # （要求までにまとめて書き込んだ行に対して1回だけ）
+                if sync:
+                    os.fsync(self._fd)
+            except Exception as e:
+                print(f"ログの書き込みに失敗しました: {str(e)}")
+            finally:
+                for _ in batch:
+                    q.task_done()
+            
+            if stop:
+                return
+
+def _acquire_writer(path: str) -> _LogWriter:
+    """
+    ログファイルのライターを取得します。
+
+    同じファイルに対するライターが既にあれば共有し、なければ新しく起動します。
+
+    Args:
+        path (str): ログファイルのパス
+
+    Returns:
+        _LogWriter: ログファイルのライター
+    """
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(path)
+        if writer is None or writer._closed:
+            writer = _WRITERS[path] = _LogWriter(path)
+        writer._refs += 1
+        return writer
+
+def _release_writer(writer: _LogWriter) -> None:
+    """
+    ライターの参照を解放し、使われなくなったライターを閉じます。
+
+    Args:
+        writer (_LogWriter): 解放するライター
+    """
+    with _WRITERS_LOCK:
+        writer._refs -= 1
+        if writer._refs > 0:
+            return
+        if _WRITERS.get(writer.path) is writer:
+            del _WRITERS[writer.path]
+    writer.close()
 
 class Logger:
     """
@@ -21,7 +289,7 @@ class Logger:
     
     アプリケーションのログ出力を管理します。
     以下の機能を提供します：
-    - ログの自動ローテーション（1MB毎、最大5ファイル）
+    - ログの自動ローテーション（16MB毎、最大5ファイル）
     - 適切なパーミッション設定（ディレクトリ: 0o755, ファイル: 0o644）
     - パスのサニタイズ（特殊文字の除去、パストラバーサル対策）
     """
@@ -49,44 +317,47 @@ class Logger:
         else:
             self.log_file = os.path.join(self.log_dir, log_file)
         
-        # ロガーの設定
-        self.logger = logging.getLogger('disk_utility')
-        self.logger.setLevel(logging.DEBUG)
+        # ロガーの取得（同名のロガーはプロセス内で共有される）
+        self.logger = logging.getLogger(_LOGGER_NAME)
         
-        # 既存のハンドラをクリア
-        self.logger.handlers.clear()
+        # テスト用にメッセージを保存するバッファ（長時間稼働でも増え続けないよう上限付き）
+        self.messages: 'deque[str]' = deque(maxlen=_MESSAGE_BUFFER_SIZE)
+        # 書き込みのたびに属性を引かないよう、appendを束縛しておく
+        self._append_msg = self.messages.append
         
-        self.messages: List[str] = []  # テスト用にメッセージを保存するリスト
+        # バックグラウンドで書き込みを行うライター
+        self._writer: Optional[_LogWriter] = None
         
         try:
-            # ファイルが存在しない場合は作成
-            if not os.path.exists(self.log_file):
-                with open(self.log_file, 'a') as f:
-                    pass
+            # ライターの取得（同じログファイルを使うインスタンス間で共有する）
+            self._writer = _acquire_writer(self.log_file)
             
-            # ログファイルのパーミッションを設定
-            os.chmod(self.log_file, 0o644)
+            # ハンドラの設定は最初のインスタンス生成時のみ行う
+            self._configure_logger()
             
-            # ローテーティングファイルハンドラの設定
-            handler = logging.handlers.RotatingFileHandler(
-                self.log_file,
-                maxBytes=1024 * 1024,  # 1MB
-                backupCount=5,
-                encoding='utf-8',
-                mode='a'
-            )
+        except Exception as e:
+            raise RuntimeError(f"ログファイルの設定に失敗しました: {str(e)}")
+    
+    def _configure_logger(self) -> None:
+        """
+        共有ロガーを設定します。
+
+        ログの書き込みはすべてライターが行うため、共有ロガーはログレベルの判定にのみ使い、
+        ハンドラは登録しません。設定はプロセス内で一度だけ行います。
+        """
+        global _LOGGER_CONFIGURED
+        with _CONFIGURE_LOCK:
+            if _LOGGER_CONFIGURED:
+                return
             
-            # フォーマッタの設定
-            formatter = logging.Formatter(
-                '%(levelname)s     %(name)s:%(filename)s:%(lineno)d %(message)s'
-            )
-            handler.setFormatter(formatter)
+            self.logger.setLevel(logging.DEBUG)
             
-            # ハンドラを追加
-            self.logger.addHandler(handler)
+            # ルートロガーへ伝播させない（ルート側のハンドラによる重複出力を防ぐ）
+            self.logger.propagate = False
             
-        except Exception as e:
-            raise RuntimeError(f"ログファイルの設定に失敗しました: {str(e)}")
+            # 既存のハンドラをクリア（同じログファイルを別のハンドラでローテーションさせない）
+            self.logger.handlers.clear()
+            _LOGGER_CONFIGURED = True
     
     def _setup_log_directory(self) -> None:
         """
@@ -96,11 +367,8 @@ class Logger:
             RuntimeError: ディレクトリの作成や権限設定に失敗した場合
         """
         try:
-            # ディレクトリが存在しない場合は作成
-            os.makedirs(self.log_dir, exist_ok=True)
-            
-            # ディレクトリのパーミッションを設定
-            os.chmod(self.log_dir, 0o755)
+            # ディレクトリが存在しない場合はパーミッションを指定して作成
+            os.makedirs(self.log_dir, mode=0o755, exist_ok=True)
             
         except Exception as e:
             raise RuntimeError(f"ログディレクトリの設定に失敗しました: {str(e)}")
@@ -116,14 +384,11 @@ class Logger:
             str: 正規化されたパス
         """
         try:
-            # まず絶対パスに変換
-            absolute = os.path.abspath(path)
-            
-            # パスを正規化（.. や . を解決）
-            normalized = os.path.normpath(absolute)
+            # 絶対パスに変換（abspathは内部で正規化も行うため .. や . も解決される）
+            normalized = os.path.abspath(path)
             
             # 特殊文字を除去（ただし、/ は保持）
-            sanitized = re.sub(r'[<>:"|?*\\]', '', normalized)
+            sanitized = normalized.translate(_SANITIZE_TABLE)
             
             return sanitized
             
@@ -143,17 +408,42 @@ class Logger:
             self._call_count += 1
             
             # ログメッセージを保存
-            self.messages.append(message)
+            self._append_msg(message)
+            
+            # ログを書き込みキューに追加（ディスクへの書き込みはライタースレッドが行う）
+            log_line = _ts() + _LEVEL_BYTES[level] + message.encode('utf-8') + b'\n'
+            self._writer.write(log_line)
             
-            # ログを書き込み
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                log_line = f"{timestamp} {level} {message}\n"
-                f.write(log_line)
-                
         except Exception as e:
             print(f"ログの書き込みに失敗しました: {str(e)}")
     
+    def flush(self, sync: bool = False) -> None:
+        """
+        出力済みのログがすべてファイルに書き込まれるまで待機します。
+
+        Args:
+            sync (bool): Trueの場合、fsyncでディスクに反映させてから戻る
+        """
+        if self._writer is not None:
+            self._writer.flush(sync)
+    
+    def close(self) -> None:
+        """
+        未書き込みのログを書き出してからログファイルを閉じます。
+        """
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            _release_writer(writer)
+    
+    def __del__(self):
+        """
+        破棄時にログファイルを閉じます。
+        """
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def info(self, message: str) -> None:
         """
         情報レベルのログを出力します。
@@ -161,6 +451,8 @@ class Logger:
         Args:
             message (str): ログメッセージ
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self._write_log('INFO', message)
     
     def warning(self, message: str) -> None:
@@ -170,6 +462,8 @@ class Logger:
         Args:
             message (str): ログメッセージ
         """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         self._write_log('WARNING', message)
     
     def error(self, message: str) -> None:
@@ -179,8 +473,25 @@ class Logger:
         Args:
             message (str): ログメッセージ
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         self._write_log('ERROR', message)
-    
+        # エラーは呼び出し元に戻る前にディスクへ書き込まれていることを保証する
+        self.flush(sync=True)
+
+    def critical(self, message: str) -> None:
+        """
+        重大エラーレベルのログを出力します。
+
+        Args:
+            message (str): ログメッセージ
+        """
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
+        self._write_log('CRITICAL', message)
+        # エラーは呼び出し元に戻る前にディスクへ書き込まれていることを保証する
+        self.flush(sync=True)
+
     def debug(self, message: str) -> None:
         """
         デバッグレベルのログを出力します。
@@ -188,4 +499,6 @@ class Logger:
         Args:
             message (str): ログメッセージ
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self._write_log('DEBUG', message)
\ No newline at end of file
@@ -6,31 +6,130 @@ USBブートLinux GUIディスクユーティリティ
 
 import os
 import sys
-import threading
 import argparse
+from functools import partial
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QListWidget, QListWidgetItem, QSplitter,
     QGroupBox, QMenu, QAction, QMessageBox,
-    QTextEdit, QRadioButton, QButtonGroup,
+    QPlainTextEdit, QRadioButton, QButtonGroup,
     QDialog
 )
-from PyQt5.QtCore import Qt
-from typing import List
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from typing import Tuple
 
 # インポート文をパッケージ相対インポートに修正
 from src.logger import Logger
-from src.disk_utils import DiskUtils, DiskInfo
+from src.disk_utils import DiskUtils, Disk
 from src.version import get_version_info, APP_NAME, __version__
 from src.config_manager import ConfigManager
-from src.settings import SettingsDialog
-from src.disk_properties import DiskPropertiesAnalyzer
-from src.properties_dialog import PropertiesDialog
+
+# ディスクリストを更新するudevイベントの種類
+_UDEV_REFRESH_ACTIONS = frozenset(("add", "remove", "change"))
+
+# 待機中にステータスバーへ表示するメッセージ
+_READY = "準備完了"
+
+# バージョン情報ダイアログの本文
+_ABOUT_TEXT = (
+    f"{APP_NAME}\n"
+    f"バージョン: {__version__}\n\n"
+    "開発者: toma4423\n"
+    "ライセンス: MIT\n\n"
+    "USBディスクのマウント、フォーマット、権限付与を\n"
+    "GUI操作で簡単に行うためのツールです。"
+)
+
+# お知らせダイアログの本文
+_ANNOUNCEMENTS_TEXT = """
+【重要なお知らせ】
+
+■ ReFSフォーマット機能について
+現在、ReFSフォーマット機能は仮実装の段階です。
+以下の制限事項があります：
+・ReFSツールのインストールが必要です
+・フォーマット操作の信頼性が限定的です
+・データの整合性チェックが不完全です
+
+■ 今後の予定
+・ReFSフォーマット機能の完全実装
+・フォーマット前のデータバックアップ機能
+・フォーマット操作のロールバック機能
+・より詳細なエラー報告機能
+
+■ ご注意
+・重要なデータの操作は必ずバックアップを取ってください
+・システムディスクへの操作は制限されています
+・一部の機能は管理者権限が必要です
+
+■ フィードバック
+機能の改善のため、ご意見・ご要望をお待ちしています。
+GitHubのIssueでご報告ください。
+"""
+
+
+class DiskWorkerSignals(QObject):
+    """
+    DiskWorkerの完了を通知するシグナル
+    """
+    # 処理を開始した時に表示するステータス（Noneの場合は表示を変えない）
+    started = pyqtSignal(object)
+    # (結果を受け取るコールバック, 操作の戻り値, 発生した例外)
+    finished = pyqtSignal(object, object, object)
+
+
+class DiskWorker(QRunnable):
+    """
+    ディスク操作をスレッドプールで実行するクラス
+
+    操作の結果はsignals.finishedで通知されるため、メッセージボックスや
+    ステータスバーの更新はすべてGUIスレッド側で行われます。
+    """
+    
+    def __init__(self, operation, callback, status=None):
+        """
+        初期化
+        
+        Args:
+            operation: ワーカースレッドで実行する処理（引数なしの呼び出し可能オブジェクト）
+            callback: GUIスレッドで結果を受け取る処理。(戻り値, 例外)を引数に呼ばれる
+            status: 処理を開始した時にステータスバーに表示する文字列
+        """
+        super().__init__()
+        self.signals = DiskWorkerSignals()
+        self._operation = operation
+        self._callback = callback
+        self._status = status
+    
+    def run(self):
+        """
+        処理を実行し、結果をシグナルで通知
+        """
+        # スレッドの空き待ちの間に「実行中」と表示しないよう、開始したことを通知する
+        self.signals.started.emit(self._status)
+        try:
+            result = self._operation()
+        except Exception as e:
+            self.signals.finished.emit(self._callback, None, e)
+        else:
+            self.signals.finished.emit(self._callback, result, None)
+
 
 class DiskUtilityApp(QMainWindow):
     """
     ディスクユーティリティのメインアプリケーションクラス
     """
+    
+    # フォーマット形式（ラジオボタンのIDの順）
+    FS_TYPES = ("ntfs", "exfat")
+    
+    # ディスクリストで一度にレイアウトする項目数
+    LIST_BATCH_SIZE = 50
+    
+    # 選択の変更をまとめる待ち時間（ミリ秒）
+    SELECT_DEBOUNCE_MS = 50
+    
     def __init__(self, test_mode=False):
         """
         初期化
@@ -51,32 +150,76 @@ class DiskUtilityApp(QMainWindow):
         self.setMinimumSize(800, 600)
         self.resize(900, 600)
         
-        # スーパーユーザー権限の確認（テストモードでない場合）
-        if not test_mode and os.geteuid() != 0:
-            QMessageBox.critical(
-                self,
-                "権限エラー", 
-                "このアプリケーションはスーパーユーザー権限で実行する必要があります。\n"
-                "`sudo`コマンドを使って再実行してください。"
-            )
-            sys.exit(1)
-        
         # ロガーの初期化
         self.logger = Logger()
         
         # ディスクユーティリティの初期化
         self.disk_utils = DiskUtils(self.logger, test_mode=test_mode)
         
-        # プロパティアナライザーの初期化
-        self.properties_analyzer = DiskPropertiesAnalyzer(self.logger)
+        # プロパティアナライザー（初めてプロパティを表示するときに作成する）
+        self._properties_analyzer = None
         
         # 選択されたディスクの保存用変数
         self.selected_unmounted_disk = None
         self.selected_mounted_disk = None
         
         # ディスクリストの初期化
-        self.unmounted_disks: List[DiskInfo] = []
-        self.mounted_disks: List[DiskInfo] = []
+        # 次の更新時に内容を比較するため、変更できないタプルで保持する
+        self.unmounted_disks: Tuple[Disk, ...] = ()
+        self.mounted_disks: Tuple[Disk, ...] = ()
+        
+        # デバイスパスからリスト項目を引くための辞書
+        self._unmounted_by_path = {}
+        self._mounted_by_path = {}
+        
+        # ディスク操作用のスレッドプールと、実行中のワーカー（処理が終わるまで参照を保持する）
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        # 操作のたびにスレッドを作り直さないよう、待機中のスレッドを終了させない
+        self._pool.setExpiryTimeout(-1)
+        self._workers = set()
+        
+        # ディスク一覧の取得用のスレッドプール
+        # フォーマットなど時間のかかる操作が実行中でも、一覧の更新を待たせないよう分けておく
+        self._refresh_pool = QThreadPool(self)
+        self._refresh_pool.setMaxThreadCount(1)
+        
+        # プロパティ取得（smartctl・fsck）用のスレッドプール
+        # 時間のかかる取得でディスク一覧の更新やディスク操作のスレッドを塞がないよう分けておく
+        self._properties_pool = QThreadPool(self)
+        self._properties_pool.setMaxThreadCount(1)
+        
+        # 最後に情報を表示したリスト項目
+        self._last_unmounted_rendered = None
+        self._last_mounted_rendered = None
+        
+        # 情報表示エリアに表示中のディスク（更新後に同じ内容なら再描画しない）
+        self._unmounted_info_disk = None
+        self._mounted_info_disk = None
+        
+        # 情報表示エリアに内容が表示されているかどうか
+        self._unmounted_info_dirty = False
+        self._mounted_info_dirty = False
+        
+        # 一度作成したダイアログは使い回す
+        self._about_box = None
+        self._announcements_dialog = None
+        self._confirm_box = None
+        
+        # ディスク情報を取得中かどうか、取得中に次の更新が要求されたかどうか
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        
+        # マウント・フォーマットを実行中のデバイスパス
+        self._busy_devices = set()
+        # 実行中・実行待ちのディスク操作の数
+        self._operations_pending = 0
+        
+        # 連続した更新要求を1回にまとめるためのタイマー
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_refresh_disk_lists)
         
         # メニューバーの作成
         self._create_menu()
@@ -85,10 +228,64 @@ class DiskUtilityApp(QMainWindow):
         self._build_gui()
         
         # ステータスバーの作成
-        self.statusBar().showMessage("準備完了")
+        self._status = self.statusBar()
+        self._reset_status()
         
-        # 起動時にディスクリストを更新
-        self._refresh_disk_lists()
+        # 起動時のディスクリスト更新はウィンドウの表示後に行う
+        # （マウント済みディスクのパネルは最初の更新時に作成される）
+        self._show_loading_placeholder(self.unmounted_disk_listbox)
+        QTimer.singleShot(0, self._do_refresh_disk_lists)
+        
+        # ブロックデバイスの追加・削除をudevから通知してもらう（監視の開始もウィンドウの表示後に行う）
+        self._udev_observer = None
+        QTimer.singleShot(0, self._start_udev_monitor)
+    
+    @property
+    def properties_analyzer(self):
+        """
+        プロパティアナライザーを返す（初回アクセス時に作成）
+        """
+        if self._properties_analyzer is None:
+            from src.disk_properties import DiskPropertiesAnalyzer
+            self._properties_analyzer = DiskPropertiesAnalyzer(self.logger)
+        return self._properties_analyzer
+    
+    def _start_udev_monitor(self):
+        """
+        udevのブロックデバイスイベントの監視を開始
+        """
+        # pyudevの読み込みには時間がかかるため、起動時ではなくここで読み込む
+        # pyudevがない環境ではディスクの自動更新を行わない（手動更新のみ）
+        try:
+            from pyudev import Context, Monitor
+            from pyudev.pyqt5 import MonitorObserver
+        except ImportError:
+            self.logger.info("pyudevが見つからないため、ディスクの自動更新は行いません")
+            return
+        
+        try:
+            monitor = Monitor.from_netlink(Context())
+            monitor.filter_by('block')
+            self._udev_observer = MonitorObserver(monitor, self)
+            self._udev_observer.deviceEvent.connect(self._on_udev_event)
+            monitor.start()
+        except Exception as e:
+            self.logger.warning(f"udevイベントの監視を開始できませんでした: {str(e)}")
+            self._udev_observer = None
+    
+    def _on_udev_event(self, device):
+        """
+        udevのブロックデバイスイベントを受け取った時の処理
+        
+        Args:
+            device: イベントが発生したデバイス
+        """
+        # ディスク構成が変わるイベントだけを対象にする
+        if device.action not in _UDEV_REFRESH_ACTIONS:
+            return
+        
+        # 連続したイベントは更新タイマーで1回にまとめられる
+        self._refresh_disk_lists(force=True)
     
     def _create_menu(self):
         """
@@ -98,9 +295,11 @@ class DiskUtilityApp(QMainWindow):
         
         # ファイルメニュー
         file_menu = menubar.addMenu("ファイル")
-        refresh_action = QAction("更新", self)
-        refresh_action.triggered.connect(self._refresh_disk_lists)
-        file_menu.addAction(refresh_action)
+        self.refresh_action = QAction("更新", self)
+        self.refresh_action.triggered.connect(lambda: self._refresh_disk_lists(force=True))
+        # 取得中はアクションごと無効化されるため、ショートカットの連打も重ならない
+        self.refresh_action.setShortcuts([QKeySequence("Ctrl+R"), QKeySequence(Qt.Key_F5)])
+        file_menu.addAction(self.refresh_action)
         
         file_menu.addSeparator()
         
@@ -153,14 +352,22 @@ class DiskUtilityApp(QMainWindow):
         # 未マウントディスクリスト（左パネル）
         self.unmounted_disk_listbox = QListWidget()
         self.unmounted_disk_listbox.setSelectionMode(QListWidget.SingleSelection)
-        self.unmounted_disk_listbox.currentItemChanged.connect(self._on_unmounted_disk_select)
+        # 項目はすべて1行なので、高さの計算を先頭の項目だけで済ませる
+        self.unmounted_disk_listbox.setUniformItemSizes(True)
+        # 項目が多い場合（LVMやdmデバイスなど）でも、レイアウトは少しずつ行って表示を止めない
+        self.unmounted_disk_listbox.setLayoutMode(QListWidget.Batched)
+        self.unmounted_disk_listbox.setBatchSize(self.LIST_BATCH_SIZE)
+        self._debounce_selection(self.unmounted_disk_listbox, self._on_unmounted_disk_select)
         left_layout.addWidget(self.unmounted_disk_listbox)
         
         # 未マウントディスク情報表示エリア
         unmounted_info_group = QGroupBox("ディスク情報")
         unmounted_info_layout = QVBoxLayout(unmounted_info_group)
-        self.unmounted_disk_info = QTextEdit()
+        # プレーンテキストしか表示しないため、リッチテキスト用のQTextEditより軽いQPlainTextEditを使う
+        self.unmounted_disk_info = QPlainTextEdit()
         self.unmounted_disk_info.setReadOnly(True)
+        # 読み取り専用なので、書き換えのたびに元に戻す履歴を記録しない
+        self.unmounted_disk_info.setUndoRedoEnabled(False)
         unmounted_info_layout.addWidget(self.unmounted_disk_info)
         left_layout.addWidget(unmounted_info_group)
         
@@ -186,29 +393,59 @@ class DiskUtilityApp(QMainWindow):
         
         ntfs_radio = QRadioButton("NTFS")
         ntfs_radio.setChecked(False)
-        self.fs_type_group.addButton(ntfs_radio)
+        self.fs_type_group.addButton(ntfs_radio, 0)
         format_layout.addWidget(ntfs_radio)
         
         exfat_radio = QRadioButton("exFAT")
         exfat_radio.setChecked(True)
-        self.fs_type_group.addButton(exfat_radio)
+        self.fs_type_group.addButton(exfat_radio, 1)
         format_layout.addWidget(exfat_radio)
         
         left_layout.addWidget(format_group)
         
-        # マウント済みディスクリスト（右パネル）
+        # マウント済みディスクのパネルの中身は最初の更新時に作成する
+        self._mounted_layout = right_layout
+        self.mounted_disk_listbox = None
+        
+        # 共通操作ボタン（下部）
+        bottom_layout = QHBoxLayout()
+        bottom_layout.addStretch()
+        
+        self.refresh_button = QPushButton("更新")
+        self.refresh_button.clicked.connect(lambda: self._refresh_disk_lists(force=True))
+        bottom_layout.addWidget(self.refresh_button)
+        
+        main_layout.addLayout(bottom_layout)
+        
+        # 右クリックメニューを追加
+        self._add_unmounted_disk_context_menu()
+    
+    def _build_mounted_panel(self):
+        """
+        マウント済みディスクのパネル（右パネル）の中身を作成（作成済みの場合は何もしない）
+        """
+        if self.mounted_disk_listbox is not None:
+            return
+        
+        # マウント済みディスクリスト
         self.mounted_disk_listbox = QListWidget()
         self.mounted_disk_listbox.setSelectionMode(QListWidget.SingleSelection)
-        self.mounted_disk_listbox.currentItemChanged.connect(self._on_mounted_disk_select)
-        right_layout.addWidget(self.mounted_disk_listbox)
+        # 項目はすべて1行なので、高さの計算を先頭の項目だけで済ませる
+        self.mounted_disk_listbox.setUniformItemSizes(True)
+        # 項目が多い場合（LVMやdmデバイスなど）でも、レイアウトは少しずつ行って表示を止めない
+        self.mounted_disk_listbox.setLayoutMode(QListWidget.Batched)
+        self.mounted_disk_listbox.setBatchSize(self.LIST_BATCH_SIZE)
+        self._debounce_selection(self.mounted_disk_listbox, self._on_mounted_disk_select)
+        self._mounted_layout.addWidget(self.mounted_disk_listbox)
         
         # マウント済みディスク情報表示エリア
         mounted_info_group = QGroupBox("ディスク情報")
         mounted_info_layout = QVBoxLayout(mounted_info_group)
-        self.mounted_disk_info = QTextEdit()
+        self.mounted_disk_info = QPlainTextEdit()
         self.mounted_disk_info.setReadOnly(True)
+        self.mounted_disk_info.setUndoRedoEnabled(False)
         mounted_info_layout.addWidget(self.mounted_disk_info)
-        right_layout.addWidget(mounted_info_group)
+        self._mounted_layout.addWidget(mounted_info_group)
         
         # マウント済みディスク操作ボタン
         mounted_button_layout = QHBoxLayout()
@@ -222,25 +459,35 @@ class DiskUtilityApp(QMainWindow):
         self.permission_button.setEnabled(False)
         mounted_button_layout.addWidget(self.permission_button)
         
-        right_layout.addLayout(mounted_button_layout)
-        
-        # 共通操作ボタン（下部）
-        bottom_layout = QHBoxLayout()
-        bottom_layout.addStretch()
-        
-        refresh_button = QPushButton("更新")
-        refresh_button.clicked.connect(self._refresh_disk_lists)
-        bottom_layout.addWidget(refresh_button)
+        self._mounted_layout.addLayout(mounted_button_layout)
+    
+    def _debounce_selection(self, list_widget, handler):
+        """
+        リストの選択変更を少し待ってから処理するように接続
         
-        main_layout.addLayout(bottom_layout)
+        矢印キーを押し続けた場合などに、途中の選択ごとに情報を表示し直さず、
+        最後の選択だけを表示する。
         
-        # 右クリックメニューを追加
-        self._add_unmounted_disk_context_menu()
+        Args:
+            list_widget (QListWidget): 対象のリストウィジェット
+            handler: 選択変更時の処理。(現在の項目, 以前の項目)を引数に呼ばれる
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.SELECT_DEBOUNCE_MS)
+        timer.timeout.connect(lambda: handler(list_widget.currentItem(), None))
+        # 待機中に再び選択が変わった場合は待ち直す
+        list_widget.currentItemChanged.connect(lambda current, previous: timer.start())
     
     def _add_unmounted_disk_context_menu(self):
         """
         未マウントディスクリストボックスに右クリックメニューを追加
         """
+        # メニューは一度だけ作成し、右クリックのたびに使い回す
+        self.unmounted_context_menu = QMenu(self)
+        properties_action = self.unmounted_context_menu.addAction("プロパティ")
+        properties_action.triggered.connect(self._show_unmounted_properties)
+        
         self.unmounted_disk_listbox.setContextMenuPolicy(Qt.CustomContextMenu)
         self.unmounted_disk_listbox.customContextMenuRequested.connect(self._show_unmounted_context_menu)
     
@@ -251,142 +498,271 @@ class DiskUtilityApp(QMainWindow):
         Args:
             position: クリックされた位置
         """
-        if self.unmounted_disk_listbox.currentItem():
-            context_menu = QMenu()
-            properties_action = context_menu.addAction("プロパティ")
-            properties_action.triggered.connect(self._show_unmounted_properties)
-            context_menu.exec_(self.unmounted_disk_listbox.mapToGlobal(position))
+        # クリックされた位置の項目を一度だけ調べ、その項目を選択してからメニューを出す
+        # （「読み込み中...」の表示などディスク情報のない項目では出さない）
+        item = self.unmounted_disk_listbox.itemAt(position)
+        if item is None or item.data(Qt.UserRole) is None:
+            return
+        if item is not self.unmounted_disk_listbox.currentItem():
+            self.unmounted_disk_listbox.setCurrentItem(item)
+        
+        self.unmounted_context_menu.exec_(self.unmounted_disk_listbox.mapToGlobal(position))
     
     def _on_unmounted_disk_select(self, current, previous):
         """
         未マウントディスクが選択された時の処理
         """
+        # 同じ項目の表示を繰り返さない
+        # 選択なしのまま（初回の更新など）の場合も、ボタンの無効化や消去は済んでいるので何もしない
+        if current is self._last_unmounted_rendered:
+            return
+        self._last_unmounted_rendered = current
+        
         if not current:
             self.mount_button.setEnabled(False)
             self.format_button.setEnabled(False)
+            # 表示中の情報があるときだけ消去する
+            if self._unmounted_info_dirty:
+                self.unmounted_disk_info.clear()
+                self._unmounted_info_dirty = False
+            self._unmounted_info_disk = None
             return
         
         try:
-            # 選択されたインデックスを取得
-            index = self.unmounted_disk_listbox.row(current)
+            # 選択されたディスク情報を表示（リスト項目に保存した情報を使う）
+            disk = current.data(Qt.UserRole)
             
-            # 選択されたディスク情報を表示
-            disk = self.unmounted_disks[index]
-            
-            # 情報を表示
-            info_text = f"名前: {disk['name']}\n"
-            info_text += f"パス: {disk['path']}\n"
-            info_text += f"サイズ: {disk['size']}\n"
-            info_text += f"タイプ: {disk['type']}\n"
-            
-            fs_type = disk['fstype'] if disk['fstype'] else "未フォーマット"
-            info_text += f"ファイルシステム: {fs_type}\n"
-            
-            self.unmounted_disk_info.setText(info_text)
+            # 一覧の更新で項目が作り直されても、内容が同じなら表示はそのまま
+            if disk != self._unmounted_info_disk:
+                self._render_unmounted_info(disk)
             
             # マウントとフォーマットボタンを有効化
             self.mount_button.setEnabled(True)
             self.format_button.setEnabled(True)
             
         except Exception as e:
+            # 選択のたびに呼ばれるため、モーダルダイアログは出さずにログとステータスバーで知らせる
             self.logger.error(f"ディスク情報の表示中にエラーが発生しました: {str(e)}")
-            QMessageBox.critical(self, "エラー", f"ディスク情報の表示中にエラーが発生しました: {str(e)}")
+            self._set_status("情報表示エラー (詳細はログ)")
+    
+    def _render_unmounted_info(self, disk):
+        """
+        未マウントディスクの情報を表示エリアに書き込む
+        
+        Args:
+            disk: 表示するディスク
+        """
+        fs_type = disk.fstype if disk.fstype else "未フォーマット"
+        # 1つのf-stringで組み立て、行ごとの文字列やリストを作らない
+        info_text = (
+            f"名前: {disk.name}\n"
+            f"パス: {disk.path}\n"
+            f"サイズ: {disk.size}\n"
+            f"タイプ: {disk.type}\n"
+            f"ファイルシステム: {fs_type}\n"
+        )
+        
+        self.unmounted_disk_info.setPlainText(info_text)
+        self._unmounted_info_dirty = True
+        self._unmounted_info_disk = disk
     
     def _on_mounted_disk_select(self, current, previous):
         """
         マウント済みディスクが選択された時の処理
         """
+        # 同じ項目の表示を繰り返さない
+        # 選択なしのまま（初回の更新など）の場合も、ボタンの無効化や消去は済んでいるので何もしない
+        if current is self._last_mounted_rendered:
+            return
+        self._last_mounted_rendered = current
+        
         if not current:
             self.open_button.setEnabled(False)
             self.permission_button.setEnabled(False)
+            # 表示中の情報があるときだけ消去する
+            if self._mounted_info_dirty:
+                self.mounted_disk_info.clear()
+                self._mounted_info_dirty = False
+            self._mounted_info_disk = None
             return
         
         try:
-            # 選択されたインデックスを取得
-            index = self.mounted_disk_listbox.row(current)
-            
-            # 選択されたディスク情報を表示
-            disk = self.mounted_disks[index]
+            # 選択されたディスク情報を表示（リスト項目に保存した情報を使う）
+            disk = current.data(Qt.UserRole)
             
-            # 情報を表示
-            info_text = f"名前: {disk['name']}\n"
-            info_text += f"パス: {disk['path']}\n"
-            info_text += f"サイズ: {disk['size']}\n"
-            info_text += f"タイプ: {disk['type']}\n"
-            info_text += f"ファイルシステム: {disk['fstype']}\n"
-            info_text += f"マウントポイント: {disk['mountpoint']}\n"
-            
-            self.mounted_disk_info.setText(info_text)
+            # 一覧の更新で項目が作り直されても、内容が同じなら表示はそのまま
+            if disk != self._mounted_info_disk:
+                self._render_mounted_info(disk)
             
             # 開くと権限付与ボタンを有効化
             self.open_button.setEnabled(True)
             self.permission_button.setEnabled(True)
             
         except Exception as e:
+            # 選択のたびに呼ばれるため、モーダルダイアログは出さずにログとステータスバーで知らせる
             self.logger.error(f"ディスク情報の表示中にエラーが発生しました: {str(e)}")
-            QMessageBox.critical(self, "エラー", f"ディスク情報の表示中にエラーが発生しました: {str(e)}")
+            self._set_status("情報表示エラー (詳細はログ)")
+    
+    def _render_mounted_info(self, disk):
+        """
+        マウント済みディスクの情報を表示エリアに書き込む
+        
+        Args:
+            disk: 表示するディスク
+        """
+        info_text = (
+            f"名前: {disk.name}\n"
+            f"パス: {disk.path}\n"
+            f"サイズ: {disk.size}\n"
+            f"タイプ: {disk.type}\n"
+            f"ファイルシステム: {disk.fstype}\n"
+            f"マウントポイント: {disk.mountpoint}\n"
+        )
+        
+        self.mounted_disk_info.setPlainText(info_text)
+        self._mounted_info_dirty = True
+        self._mounted_info_disk = disk
+    
+    def _refresh_disk_lists(self, force=False):
+        """
+        ディスクリストの更新を予約（150ms以内の要求は1回の更新にまとめる）
+        
+        Args:
+            force: Trueの場合はキャッシュを破棄してディスク情報を取得し直す
+        """
+        if force:
+            self.disk_utils.invalidate_cache()
+        self._refresh_timer.start()
+    
+    def _do_refresh_disk_lists(self):
+        """
+        ディスクリストの更新を開始（ディスク情報はワーカースレッドで取得する）
+        """
+        self._refresh_timer.stop()
+        
+        # 取得中の場合は重ねて実行せず、完了後に1回だけ取り直す
+        if self._refresh_in_flight:
+            self._refresh_pending = True
+            return
+        self._refresh_in_flight = True
+        
+        # 取得が終わるまで手動の更新は受け付けない
+        self.refresh_button.setEnabled(False)
+        self.refresh_action.setEnabled(False)
+        self._set_status("ディスク情報を取得中...")
+        # lsblkを一度だけ実行し、同じツリーから未マウント・マウント済みを振り分ける
+        self._run_in_worker(self._collect_disks, self._apply_disk_lists, pool=self._refresh_pool)
+    
+    def _collect_disks(self):
+        """
+        ディスク情報を取得し、未マウント・マウント済みに振り分ける（ワーカースレッドで実行される）
+        
+        リストに表示する文字列もDiskの作成時に組み立てられるため、GUIスレッドでは行わない。
+        
+        Returns:
+            tuple: (未マウントディスクのタプル, マウント済みディスクのタプル)。
+                テストモードではマウント済みディスクは振り分けない
+        """
+        disks_data = self.disk_utils.get_all_disks()
+        collect_mounted = not self.test_mode
+        
+        # 一度の走査で未マウント・マウント済みへ振り分ける
+        # 未マウント（フォーマット対象）に並べるのはディスク本体（type=disk）のみで、
+        # パーティションはマウント済みの場合にだけマウント済みリストへ加える
+        unmounted_disks = []
+        mounted_disks = []
+        for device in disks_data.get("blockdevices", []):
+            mountpoint = device.get("mountpoint")
+            if mountpoint:
+                if collect_mounted:
+                    mounted_disks.append(Disk.from_lsblk(device))
+            elif mountpoint is None and device.get("type") == "disk":
+                unmounted_disks.append(Disk.from_lsblk(device))
+            
+            if collect_mounted:
+                for partition in device.get("children", []):
+                    if partition.get("mountpoint"):
+                        mounted_disks.append(Disk.from_lsblk(partition))
+        return tuple(unmounted_disks), tuple(mounted_disks)
     
-    def _refresh_disk_lists(self):
+    def _apply_disk_lists(self, disks, error):
         """
-        ディスクリストを更新
+        取得したディスク情報でディスクリストを更新（GUIスレッドで実行される）
+        
+        Args:
+            disks: _collect_disksの戻り値（未マウント・マウント済みディスクのタプル）
+            error: 取得中に発生した例外（成功時はNone）
         """
+        self._refresh_in_flight = False
+        self.refresh_button.setEnabled(True)
+        self.refresh_action.setEnabled(True)
+        self._reset_status()
+        self._build_mounted_panel()
+        
+        # 取得中に更新要求があった場合は、この結果を反映した後に取り直す
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_timer.start()
+        
         try:
-            # 未マウントディスクのリストを取得
-            disks_data = self.disk_utils.get_unmounted_disks()
-            
-            # リストをクリア
-            self.unmounted_disk_listbox.clear()
-            self.unmounted_disks = []
-            
-            # 未マウントディスクを追加
-            for device in disks_data.get("blockdevices", []):
-                # ディスク自体の処理
-                if device.get("mountpoint") is None and device.get("type") == "disk":
-                    disk_info: DiskInfo = {
-                        "name": device.get("name"),
-                        "path": f"/dev/{device.get('name')}",
-                        "device": f"/dev/{device.get('name')}",  # deviceフィールドを追加
-                        "size": device.get("size"),
-                        "type": device.get("type"),
-                        "fstype": device.get("fstype", ""),
-                        "mountpoint": None
+            if error is not None:
+                raise error
+            unmounted_disks, mounted_disks = disks
+            
+            # 更新後も同じディスクを選択したままにするため、選択中のデバイスパスを控える
+            selected_unmounted = self._selected_path(self.unmounted_disk_listbox)
+            selected_mounted = self._selected_path(self.mounted_disk_listbox)
+            
+            # マウント済みディスクのリストはテストモードでは更新しない（判定はここで一度だけ行う）
+            update_mounted = not self.test_mode
+            
+            # 再描画とシグナルを止めてからまとめてリストを作り直す
+            list_widgets = [self.unmounted_disk_listbox]
+            if update_mounted:
+                list_widgets.append(self.mounted_disk_listbox)
+            for list_widget in list_widgets:
+                list_widget.setUpdatesEnabled(False)
+                list_widget.blockSignals(True)
+            
+            try:
+                # 前回と内容が同じリストは項目を作り直さない
+                # （項目数が合わない場合は「読み込み中...」の表示が残っているので作り直す）
+                if (unmounted_disks != self.unmounted_disks
+                        or self.unmounted_disk_listbox.count() != len(unmounted_disks)):
+                    self.unmounted_disks = unmounted_disks
+                    self.unmounted_disk_listbox.clear()
+                    self._unmounted_by_path = {
+                        disk_info.path: self._add_disk_to_list(disk_info, self.unmounted_disk_listbox)
+                        for disk_info in self.unmounted_disks
                     }
-                    self.unmounted_disks.append(disk_info)
-                    self._add_disk_to_list(disk_info, self.unmounted_disk_listbox)
                 
-                # パーティションの処理
-                for partition in device.get("children", []):
-                    if partition.get("mountpoint") is None and partition.get("type") == "part":
-                        partition_info: DiskInfo = {
-                            "name": partition.get("name"),
-                            "path": f"/dev/{partition.get('name')}",
-                            "device": f"/dev/{partition.get('name')}",  # deviceフィールドを追加
-                            "size": partition.get("size"),
-                            "type": partition.get("type"),
-                            "fstype": partition.get("fstype", ""),
-                            "mountpoint": None
+                # マウント済みディスクのリスト
+                if update_mounted:
+                    if (mounted_disks != self.mounted_disks
+                            or self.mounted_disk_listbox.count() != len(mounted_disks)):
+                        self.mounted_disks = mounted_disks
+                        self.mounted_disk_listbox.clear()
+                        self._mounted_by_path = {
+                            disk_info.path: self._add_disk_to_list(disk_info, self.mounted_disk_listbox)
+                            for disk_info in self.mounted_disks
                         }
-                        self.unmounted_disks.append(partition_info)
-                        self._add_disk_to_list(partition_info, self.unmounted_disk_listbox)
-            
-            # マウント済みディスクのリストを取得（テストモードでは空のリストを返す）
-            if not self.test_mode:
-                mounted_disks = self.disk_utils.get_mounted_disks()
-                self.mounted_disk_listbox.clear()
-                self.mounted_disks = []
-                for disk in mounted_disks:
-                    # マウント済みディスクの情報を統一された形式に変換
-                    disk_info: DiskInfo = {
-                        "name": disk.get("name", os.path.basename(disk.get("path", ""))),
-                        "path": disk.get("path", ""),
-                        "device": disk.get("path", ""),  # deviceフィールドを追加
-                        "size": disk.get("size", "Unknown"),
-                        "type": disk.get("type", "disk"),
-                        "mountpoint": disk.get("mountpoint", ""),
-                        "fstype": disk.get("fstype", "")
-                    }
-                    self.mounted_disks.append(disk_info)
-                    self._add_disk_to_list(disk_info, self.mounted_disk_listbox)
+                
+                # 以前の選択を復元（シグナルは止めたまま）
+                unmounted_item = self._unmounted_by_path.get(selected_unmounted)
+                if unmounted_item is not None:
+                    self.unmounted_disk_listbox.setCurrentItem(unmounted_item)
+                mounted_item = self._mounted_by_path.get(selected_mounted)
+                if mounted_item is not None:
+                    self.mounted_disk_listbox.setCurrentItem(mounted_item)
+            finally:
+                for list_widget in list_widgets:
+                    list_widget.blockSignals(False)
+                    list_widget.setUpdatesEnabled(True)
+            
+            # シグナルを止めていたため、選択の処理をここで反映する（復元できなければ選択解除）
+            self._on_unmounted_disk_select(unmounted_item, None)
+            if update_mounted:
+                self._on_mounted_disk_select(mounted_item, None)
             
             self.logger.info("ディスクリストを更新しました")
             
@@ -398,253 +774,340 @@ class DiskUtilityApp(QMainWindow):
                 f"ディスクリストの更新に失敗しました:\n{str(e)}"
             )
     
+    def _selected_path(self, list_widget):
+        """
+        リストで選択中のディスクのデバイスパスを返す
+        
+        Args:
+            list_widget (QListWidget): 対象のリストウィジェット
+            
+        Returns:
+            str: デバイスパス。選択されていない場合はNone
+        """
+        item = list_widget.currentItem()
+        if item is None:
+            return None
+        disk = item.data(Qt.UserRole)
+        return disk.path if disk is not None else None
+    
+    def _show_loading_placeholder(self, list_widget):
+        """
+        ディスクリストの読み込み中であることを示す項目を表示
+        
+        Args:
+            list_widget (QListWidget): 表示先のリストウィジェット
+        """
+        item = QListWidgetItem("読み込み中...")
+        item.setFlags(Qt.NoItemFlags)
+        list_widget.addItem(item)
+    
     def _add_disk_to_list(self, disk_info, list_widget):
         """
         ディスク情報をリストに追加
         
         Args:
-            disk_info (dict): ディスク情報
+            disk_info (Disk): ディスク情報
             list_widget (QListWidget): 追加先のリストウィジェット
+            
+        Returns:
+            QListWidgetItem: 追加したリスト項目
         """
-        name = disk_info.get("name", "Unknown")
-        size = disk_info.get("size", "Unknown")
-        fs_type = disk_info.get("fstype", "")
-        fs_type_str = f" ({fs_type})" if fs_type else ""
-        
-        item = QListWidgetItem(f"{name} - {size}{fs_type_str}")
+        # 親を指定して作成すると、そのままリストの末尾に追加される（addItemの呼び出しが不要）
+        item = QListWidgetItem(disk_info.display_text, list_widget)
         item.setData(Qt.UserRole, disk_info)
-        list_widget.addItem(item)
+        return item
+    
+    def _set_status(self, text):
+        """
+        ステータスバーに表示する文字列を設定
+        
+        Args:
+            text: 表示する文字列
+        """
+        # 表示中と同じ文字列なら、再描画やシグナル発行を伴う更新を行わない
+        if self._status.currentMessage() != text:
+            self._status.showMessage(text)
+    
+    def _reset_status(self):
+        """
+        ステータスバーの表示を「準備完了」に戻す
+        
+        実行中・実行待ちのディスク操作が残っている場合は、その件数を表示する。
+        """
+        if self._operations_pending:
+            self._set_status(f"ディスク操作を実行中です（残り{self._operations_pending}件）")
+        else:
+            self._set_status(_READY)
+    
+    def _run_in_worker(self, operation, callback, pool=None, status=None):
+        """
+        処理をワーカースレッドで実行し、結果をGUIスレッドで受け取る
+        
+        Args:
+            operation: ワーカースレッドで実行する処理
+            callback: 結果を受け取る処理。(戻り値, 例外)を引数にGUIスレッドで呼ばれる
+            pool: 実行するスレッドプール（省略時はディスク操作用のプール）
+            status: 処理を開始した時にステータスバーに表示する文字列
+        """
+        worker = DiskWorker(operation, callback, status)
+        worker.signals.started.connect(self._on_worker_started)
+        worker.signals.finished.connect(self._on_worker_finished)
+        
+        self._workers.add(worker.signals)
+        (pool or self._pool).start(worker)
+    
+    @pyqtSlot(object)
+    def _on_worker_started(self, status):
+        """
+        ワーカーが処理を開始した時の処理（GUIスレッドで実行される）
+        
+        Args:
+            status: ステータスバーに表示する文字列（Noneの場合は表示を変えない）
+        """
+        if status is not None:
+            self._set_status(status)
+    
+    @pyqtSlot(object, object, object)
+    def _on_worker_finished(self, callback, result, error):
+        """
+        ワーカーの処理完了時の処理（GUIスレッドで実行される）
+        
+        Args:
+            callback: 結果を受け取る処理
+            result: 処理の戻り値
+            error: 処理中に発生した例外（成功時はNone）
+        """
+        self._workers.discard(self.sender())
+        callback(result, error)
+    
+    def _device_busy(self, device_path):
+        """
+        デバイスにマウント・フォーマットを実行中かどうかを確認
+        
+        確認ダイアログを出す前に呼び出し、実行できない操作を確認させないようにする。
+        
+        Args:
+            device_path: デバイスパス
+            
+        Returns:
+            bool: 実行中の場合はTrue（ステータスバーに案内を表示する）
+        """
+        if device_path in self._busy_devices:
+            self._set_status(f"{device_path} への操作が完了するまでお待ちください")
+            return True
+        return False
+    
+    def _run_operation(self, operation, label, status, success=None, failure=None, refresh=False, device=None):
+        """
+        ディスク操作をワーカースレッドで実行し、完了後に結果を表示
+        
+        Args:
+            operation: 実行する処理（戻り値は (成功したか, ..., エラーメッセージ) のタプル）
+            label: ログやエラー表示に使う処理名
+            status: 処理を開始した時にステータスバーに表示する文字列
+            success: 成功時に表示する (タイトル, メッセージ)。メッセージの {} には
+                戻り値の途中の要素（マウントポイントなど）が入る。Noneの場合は表示しない
+            failure: 失敗時に表示する (タイトル, メッセージ)
+            refresh: 成功時にディスクリストを取り直すかどうか
+            device: 同じデバイスへの操作を並行して走らせないマウント・フォーマットの場合、
+                そのデバイスパス（呼び出し前に_device_busyで確認しておく）
+        """
+        if device is not None:
+            self._busy_devices.add(device)
+        
+        # 他の操作でスレッドが埋まっている場合は、開始を待っていることを表示する
+        if self._pool.activeThreadCount() >= self._pool.maxThreadCount():
+            self._set_status(f"{label}: 実行中のディスク操作の完了を待っています...")
+        self._operations_pending += 1
+        
+        self._run_in_worker(
+            operation,
+            partial(self._on_operation_finished, label, success, failure, refresh, device),
+            status=status
+        )
+    
+    def _on_operation_finished(self, label, success, failure, refresh, device, result, error):
+        """
+        ディスク操作の完了時に結果を表示（GUIスレッドで実行される）
+        
+        Args:
+            label: ログやエラー表示に使う処理名
+            success: 成功時に表示する (タイトル, メッセージ)。Noneの場合は表示しない
+            failure: 失敗時に表示する (タイトル, メッセージ)
+            refresh: 成功時にディスクリストを取り直すかどうか
+            device: 操作中として記録したデバイスパス（記録していない場合はNone）
+            result: 処理の戻り値
+            error: 処理中に発生した例外（成功時はNone）
+        """
+        self._busy_devices.discard(device)
+        self._operations_pending -= 1
+        
+        if error is not None:
+            self.logger.error(f"{label}処理中にエラーが発生しました: {str(error)}")
+            QMessageBox.critical(
+                self,
+                "エラー",
+                f"{label}処理中にエラーが発生しました: {str(error)}"
+            )
+        else:
+            succeeded, *details, error_msg = result
+            
+            if succeeded:
+                if success is not None:
+                    title, message = success
+                    # 途中の要素がない場合はメッセージをそのまま使う（パスに含まれる { } を解釈しない）
+                    if details:
+                        message = message.format(*details)
+                    QMessageBox.information(self, title, message)
+                if refresh:
+                    self._refresh_disk_lists(force=True)
+            else:
+                title, message = failure
+                QMessageBox.critical(
+                    self,
+                    title,
+                    f"{message}\n"
+                    f"エラー: {error_msg}"
+                )
+        
+        # ステータスをリセット
+        self._reset_status()
     
     def _mount_selected_disk(self):
         """
         選択された未マウントディスクをマウント
         """
         try:
-            # 選択されたインデックスを取得
+            # 選択された項目を取得
             current_item = self.unmounted_disk_listbox.currentItem()
             if not current_item:
                 return
             
-            index = self.unmounted_disk_listbox.row(current_item)
-            disk = self.unmounted_disks[index]
+            disk = current_item.data(Qt.UserRole)
+            
+            # 同じディスクへのマウント・フォーマットが実行中なら受け付けない
+            if self._device_busy(disk.path):
+                return
             
             # マウントの処理を別スレッドで実行
-            self.statusBar().showMessage(f"{disk['name']} をマウント中...")
-            
-            def mount_thread():
-                try:
-                    success, mount_point, error_msg = self.disk_utils.mount_disk(disk['path'])
-                    
-                    if success:
-                        QMessageBox.information(
-                            self,
-                            "マウント成功",
-                            f"{disk['name']} を {mount_point} にマウントしました。"
-                        )
-                        self._refresh_disk_lists()
-                    else:
-                        QMessageBox.critical(
-                            self,
-                            "マウントエラー",
-                            f"{disk['name']} のマウントに失敗しました。\n"
-                            f"エラー: {error_msg}"
-                        )
-                    
-                    # ステータスをリセット
-                    self.statusBar().showMessage("準備完了")
-                    
-                except Exception as e:
-                    self.logger.error(f"マウント処理中にエラーが発生しました: {str(e)}")
-                    QMessageBox.critical(
-                        self,
-                        "エラー",
-                        f"マウント処理中にエラーが発生しました: {str(e)}"
-                    )
-                    # ステータスをリセット
-                    self.statusBar().showMessage("準備完了")
-            
-            thread = threading.Thread(target=mount_thread)
-            thread.daemon = True
-            thread.start()
+            self._run_operation(
+                partial(self.disk_utils.mount_disk, disk.path),
+                "マウント",
+                f"{disk.name} をマウント中...",
+                success=("マウント成功", f"{disk.name} を {{}} にマウントしました。"),
+                failure=("マウントエラー", f"{disk.name} のマウントに失敗しました。"),
+                refresh=True,
+                device=disk.path
+            )
             
         except Exception as e:
             self.logger.error(f"マウント処理の準備中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(self, "エラー", f"マウント処理の準備中にエラーが発生しました: {str(e)}")
-            self.statusBar().showMessage("準備完了")
+            self._reset_status()
     
     def _format_selected_disk(self):
         """
         選択された未マウントディスクをフォーマット
         """
         try:
-            # 選択されたインデックスを取得
+            # 選択された項目を取得
             current_item = self.unmounted_disk_listbox.currentItem()
             if not current_item:
                 return
             
-            index = self.unmounted_disk_listbox.row(current_item)
-            disk = self.unmounted_disks[index]
+            disk = current_item.data(Qt.UserRole)
+            
+            # 同じディスクへのマウント・フォーマットが実行中なら、確認ダイアログを出す前に断る
+            if self._device_busy(disk.path):
+                return
             
             # フォーマット形式取得
-            fs_type = "ntfs" if self.fs_type_group.checkedButton().text() == "NTFS" else "exfat"
+            # ボタンIDはFS_TYPESのインデックスに対応する
+            fs_type = self.FS_TYPES[self.fs_type_group.checkedId()]
             
             # 確認ダイアログを表示
-            reply = QMessageBox.question(
-                self,
-                "確認",
-                f"{disk['name']} ({disk['path']}) を {fs_type} でフォーマットします。\n"
+            if not self._confirm(
+                f"{disk.name} ({disk.path}) を {fs_type} でフォーマットします。\n"
                 f"すべてのデータが消去されます。\n\n"
-                f"続行しますか？",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.No:
+                f"続行しますか？"
+            ):
                 return
             
             # フォーマットの処理を別スレッドで実行
-            self.statusBar().showMessage(f"{disk['name']} をフォーマット中...")
-            
-            def format_thread():
-                try:
-                    success, error_msg = self.disk_utils.format_disk(disk['path'], fs_type)
-                    
-                    if success:
-                        QMessageBox.information(
-                            self,
-                            "フォーマット成功",
-                            f"{disk['name']} を {fs_type} 形式でフォーマットしました。"
-                        )
-                    else:
-                        QMessageBox.critical(
-                            self,
-                            "フォーマットエラー",
-                            f"{disk['name']} のフォーマットに失敗しました。\n"
-                            f"エラー: {error_msg}"
-                        )
-                    
-                    # ステータスをリセット
-                    self.statusBar().showMessage("準備完了")
-                    
-                except Exception as e:
-                    self.logger.error(f"フォーマット処理中にエラーが発生しました: {str(e)}")
-                    QMessageBox.critical(
-                        self,
-                        "エラー",
-                        f"フォーマット処理中にエラーが発生しました: {str(e)}"
-                    )
-                    # ステータスをリセット
-                    self.statusBar().showMessage("準備完了")
-            
-            thread = threading.Thread(target=format_thread)
-            thread.daemon = True
-            thread.start()
+            self._run_operation(
+                partial(self.disk_utils.format_disk, disk.path, fs_type),
+                "フォーマット",
+                f"{disk.name} をフォーマット中...",
+                success=("フォーマット成功", f"{disk.name} を {fs_type} 形式でフォーマットしました。"),
+                failure=("フォーマットエラー", f"{disk.name} のフォーマットに失敗しました。"),
+                refresh=True,
+                device=disk.path
+            )
             
         except Exception as e:
             self.logger.error(f"フォーマット処理の準備中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(self, "エラー", f"フォーマット処理の準備中にエラーが発生しました: {str(e)}")
-            self.statusBar().showMessage("準備完了")
+            self._reset_status()
     
     def _open_selected_disk(self):
         """
         選択されたマウント済みディスクをファイルマネージャーで開く
         """
         try:
-            # 選択されたインデックスを取得
+            # 選択された項目を取得
             current_item = self.mounted_disk_listbox.currentItem()
             if not current_item:
                 return
             
-            index = self.mounted_disk_listbox.row(current_item)
-            disk = self.mounted_disks[index]
-            
-            self.statusBar().showMessage(f"{disk['mountpoint']} をファイルマネージャーで開いています...")
-            
-            success, error_msg = self.disk_utils.open_file_manager(disk['mountpoint'])
-            
-            if not success:
-                QMessageBox.critical(
-                    self,
-                    "エラー",
-                    f"ファイルマネージャーの起動に失敗しました。\n"
-                    f"エラー: {error_msg}"
-                )
+            disk = current_item.data(Qt.UserRole)
             
-            self.statusBar().showMessage("準備完了")
+            # xdg-openのfork/execでUIが止まらないよう別スレッドで起動する
+            # ディスク構成は変わらないので一覧の再取得は行わない
+            self._run_operation(
+                partial(self.disk_utils.open_file_manager, disk.mountpoint),
+                "ファイルマネージャー起動",
+                f"{disk.mountpoint} をファイルマネージャーで開いています...",
+                failure=("エラー", "ファイルマネージャーの起動に失敗しました。")
+            )
             
         except Exception as e:
             self.logger.error(f"ファイルマネージャー起動中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(self, "エラー", f"ファイルマネージャー起動中にエラーが発生しました: {str(e)}")
-            self.statusBar().showMessage("準備完了")
+            self._reset_status()
     
     def _set_permissions_to_selected_disk(self):
         """
         選択されたマウント済みディスクに権限を付与
         """
         try:
-            # 選択されたインデックスを取得
+            # 選択された項目を取得
             current_item = self.mounted_disk_listbox.currentItem()
             if not current_item:
                 return
             
-            index = self.mounted_disk_listbox.row(current_item)
-            disk = self.mounted_disks[index]
+            disk = current_item.data(Qt.UserRole)
             
             # 確認ダイアログを表示
-            reply = QMessageBox.question(
-                self,
-                "確認",
-                f"{disk['mountpoint']} に読み書き権限を付与します。\n\n"
-                f"続行しますか？",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.No:
+            if not self._confirm(
+                f"{disk.mountpoint} に読み書き権限を付与します。\n\n"
+                f"続行しますか？"
+            ):
                 return
             
             # 権限付与の処理を別スレッドで実行
-            self.statusBar().showMessage(f"{disk['mountpoint']} に権限を付与中...")
-            
-            def permission_thread():
-                try:
-                    success, error_msg = self.disk_utils.set_permissions(disk['mountpoint'])
-                    
-                    if success:
-                        QMessageBox.information(
-                            self,
-                            "権限付与成功",
-                            f"{disk['mountpoint']} に読み書き権限を付与しました。"
-                        )
-                    else:
-                        QMessageBox.critical(
-                            self,
-                            "権限付与エラー",
-                            f"{disk['mountpoint']} への権限付与に失敗しました。\n"
-                            f"エラー: {error_msg}"
-                        )
-                    
-                    # ステータスをリセット
-                    self.statusBar().showMessage("準備完了")
-                    
-                except Exception as e:
-                    self.logger.error(f"権限付与処理中にエラーが発生しました: {str(e)}")
-                    QMessageBox.critical(
-                        self,
-                        "エラー",
-                        f"権限付与処理中にエラーが発生しました: {str(e)}"
-                    )
-                    # ステータスをリセット
-                    self.statusBar().showMessage("準備完了")
-            
-            thread = threading.Thread(target=permission_thread)
-            thread.daemon = True
-            thread.start()
+            # 一覧の再取得は行わない: 権限変更ではディスク構成は変わらない
+            self._run_operation(
+                partial(self.disk_utils.set_permissions, disk.mountpoint),
+                "権限付与",
+                f"{disk.mountpoint} に権限を付与中...",
+                success=("権限付与成功", f"{disk.mountpoint} に読み書き権限を付与しました。"),
+                failure=("権限付与エラー", f"{disk.mountpoint} への権限付与に失敗しました。")
+            )
             
         except Exception as e:
             self.logger.error(f"権限付与処理の準備中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(self, "エラー", f"権限付与処理の準備中にエラーが発生しました: {str(e)}")
-            self.statusBar().showMessage("準備完了")
+            self._reset_status()
     
     def _show_unmounted_properties(self):
         """
@@ -657,26 +1120,46 @@ class DiskUtilityApp(QMainWindow):
                 QMessageBox.warning(self, "警告", "ディスクが選択されていません。")
                 return
             
-            # 選択されたインデックスを取得
-            index = self.unmounted_disk_listbox.row(current_item)
-            disk = self.unmounted_disks[index]
+            disk = current_item.data(Qt.UserRole)
             
-            self.logger.info(f"プロパティ表示: {disk['name']}")
+            self.logger.info(f"プロパティ表示: {disk.name}")
             
             # デバイスパスを取得
-            device_path = disk.get("device") or disk.get("path")
+            device_path = disk.device or disk.path
             if not device_path:
                 self.logger.error("デバイスパスが見つかりません")
                 QMessageBox.critical(self, "エラー", "デバイスパスが見つかりません。")
                 return
             
-            # プロパティアナライザーを作成
-            properties_analyzer = DiskPropertiesAnalyzer(self.logger)
+            # smartctlなどの完了待ちでUIが止まらないよう、ワーカースレッドで取得する
+            # （S.M.A.R.T.情報やファイルシステムの状態は、表示のたびに取り直す）
+            self._run_in_worker(
+                partial(self.properties_analyzer.get_disk_properties, device_path),
+                partial(self._on_properties_ready, device_path),
+                pool=self._properties_pool,
+                status=f"{disk.name} のプロパティを取得中..."
+            )
             
-            # プロパティ情報を取得
-            properties = properties_analyzer.get_disk_properties(device_path)
+        except Exception as e:
+            self.logger.error(f"プロパティ表示中にエラーが発生しました: {str(e)}")
+            QMessageBox.critical(self, "エラー", f"プロパティ表示中にエラーが発生しました。\n{str(e)}")
+    
+    def _on_properties_ready(self, device_path, properties, error):
+        """
+        プロパティ情報の取得完了時にダイアログを表示（GUIスレッドで実行される）
+        
+        Args:
+            device_path: デバイスパス
+            properties: 取得したプロパティ情報
+            error: 取得中に発生した例外（成功時はNone）
+        """
+        self._reset_status()
+        try:
+            if error is not None:
+                raise error
             
             # プロパティダイアログを表示
+            from src.properties_dialog import PropertiesDialog
             dialog = PropertiesDialog(self, properties, device_path, self.logger)
             dialog.exec_()
             
@@ -684,25 +1167,61 @@ class DiskUtilityApp(QMainWindow):
             self.logger.error(f"プロパティ表示中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(self, "エラー", f"プロパティ表示中にエラーが発生しました。\n{str(e)}")
     
+    def closeEvent(self, event):
+        """
+        ウィンドウを閉じる時の処理
+        
+        Args:
+            event: クローズイベント
+        """
+        # 未着手のディスク操作・一覧の取得・プロパティ取得は破棄する
+        self._pool.clear()
+        self._refresh_pool.clear()
+        self._properties_pool.clear()
+        super().closeEvent(event)
+    
+    def _confirm(self, message):
+        """
+        確認ダイアログを表示（ダイアログは一度作成したものを使い回す）
+        
+        Args:
+            message: 表示するメッセージ
+            
+        Returns:
+            bool: 「はい」が選ばれた場合はTrue
+        """
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(
+                QMessageBox.Question,
+                "確認",
+                "",
+                QMessageBox.Yes | QMessageBox.No,
+                self
+            )
+        # 誤操作を防ぐため、毎回「いいえ」を既定のボタンにする
+        self._confirm_box.setDefaultButton(QMessageBox.No)
+        self._confirm_box.setText(message)
+        return self._confirm_box.exec_() == QMessageBox.Yes
+    
     def _show_about(self):
         """
         バージョン情報を表示
         """
-        QMessageBox.information(
-            self,
-            "バージョン情報",
-            f"{APP_NAME}\n"
-            f"バージョン: {__version__}\n\n"
-            "開発者: toma4423\n"
-            "ライセンス: MIT\n\n"
-            "USBディスクのマウント、フォーマット、権限付与を\n"
-            "GUI操作で簡単に行うためのツールです。"
-        )
+        if self._about_box is None:
+            self._about_box = QMessageBox(
+                QMessageBox.Information,
+                "バージョン情報",
+                _ABOUT_TEXT,
+                QMessageBox.Ok,
+                self
+            )
+        self._about_box.exec_()
     
     def open_settings_dialog(self):
         """
         設定ダイアログを開く
         """
+        from src.settings import SettingsDialog
         dialog = SettingsDialog(self, self.config_manager, self.logger)
         dialog.exec_()
         # 設定変更後にディスクリストを更新
@@ -710,31 +1229,11 @@ class DiskUtilityApp(QMainWindow):
     
     def show_announcements(self):
         """お知らせを新しいウィンドウで表示"""
-        announcements = """
-【重要なお知らせ】
-
-■ ReFSフォーマット機能について
-現在、ReFSフォーマット機能は仮実装の段階です。
-以下の制限事項があります：
-・ReFSツールのインストールが必要です
-・フォーマット操作の信頼性が限定的です
-・データの整合性チェックが不完全です
-
-■ 今後の予定
-・ReFSフォーマット機能の完全実装
-・フォーマット前のデータバックアップ機能
-・フォーマット操作のロールバック機能
-・より詳細なエラー報告機能
-
-■ ご注意
-・重要なデータの操作は必ずバックアップを取ってください
-・システムディスクへの操作は制限されています
-・一部の機能は管理者権限が必要です
-
-■ フィードバック
-機能の改善のため、ご意見・ご要望をお待ちしています。
-GitHubのIssueでご報告ください。
-"""
+        # お知らせダイアログは初回だけ作成し、以降は使い回す
+        if self._announcements_dialog is not None:
+            self._announcements_dialog.exec_()
+            return
+        
         # お知らせダイアログを作成
         dialog = QDialog(self)
         dialog.setWindowTitle("お知らせ")
@@ -745,9 +1244,9 @@ GitHubのIssueでご報告ください。
         layout = QVBoxLayout()
         
         # テキストエディタを作成
-        text_edit = QTextEdit()
+        text_edit = QPlainTextEdit()
         text_edit.setReadOnly(True)
-        text_edit.setPlainText(announcements)
+        text_edit.setPlainText(_ANNOUNCEMENTS_TEXT)
         layout.addWidget(text_edit)
         
         # OKボタンを追加
@@ -762,6 +1261,7 @@ GitHubのIssueでご報告ください。
         dialog.setLayout(layout)
         
         # ダイアログを表示
+        self._announcements_dialog = dialog
         dialog.exec_()
 
 
@@ -773,6 +1273,16 @@ def main():
     parser.add_argument("--test", action="store_true", help="テストモードで実行（権限チェックをスキップ）")
     args = parser.parse_args()
 
+    # スーパーユーザー権限の確認（テストモードでない場合）
+    # Qtを初期化する前に確認し、権限がなければウィンドウを作らずに終了する
+    if not args.test and os.geteuid() != 0:
+        print(
+            "このアプリケーションはスーパーユーザー権限で実行する必要があります。\n"
+            "`sudo`コマンドを使って再実行してください。",
+            file=sys.stderr
+        )
+        sys.exit(1)
+
     app = QApplication(sys.argv)
     window = DiskUtilityApp(test_mode=args.test)
     window.show()
@@ -3,12 +3,16 @@
 Disk Utilityのバージョン情報を管理するモジュール
 """
 
+from functools import cache
+
 # バージョン情報
 VERSION = "0.1.5"
 __version__ = VERSION
 APP_NAME = "Disk Utility"
 COPYRIGHT = "© 2024 Disk Utility Team"
 
+# 戻り値は定数から作られるため、一度作った文字列を使い回す
+@cache
 def get_version_info():
     """
     アプリケーション名とバージョンを返す
@@ -18,6 +22,7 @@ def get_version_info():
     """
     return f"{APP_NAME} v{VERSION}"
 
+@cache
 def get_about_info():
     """
     アプリケーションの詳細情報を返す
@@ -73,6 +73,68 @@ class TestDiskUtils:
         # lsblkコマンドが実行されたことを確認
         mock_check_output.assert_called()
     
+    @patch('subprocess.check_output')
+    def test_get_all_disks(self, mock_check_output, disk_utils):
+        """全ディスク情報の一括取得テスト"""
+        mock_output = {
+            "blockdevices": [
+                {
+                    "name": "sda",
+                    "size": "100G",
+                    "type": "disk",
+                    "mountpoint": None,
+                    "fstype": None,
+                    "children": [
+                        {"name": "sda1", "size": "50G", "type": "part", "mountpoint": "/mnt/data", "fstype": "ext4"}
+                    ]
+                }
+            ]
+        }
+        mock_check_output.return_value = json.dumps(mock_output).encode('utf-8')
+        
+        result = disk_utils.get_all_disks()
+        
+        # 子デバイスを含むツリーがそのまま返され、lsblkは一度だけ実行される
+        assert result == mock_output
+        mock_check_output.assert_called_once()
+    
+    @patch('subprocess.check_output')
+    def test_get_all_disks_cache(self, mock_check_output, disk_utils):
+        """ディスク構成が変わらない間はlsblkを再実行しないことのテスト"""
+        mock_check_output.return_value = json.dumps({"blockdevices": []}).encode('utf-8')
+        
+        with patch.object(disk_utils, '_get_disk_stamp', return_value=(1, "mounts")) as mock_stamp:
+            disk_utils.get_all_disks()
+            disk_utils.get_all_disks()
+            assert mock_check_output.call_count == 1
+            
+            # 構成が変わった場合は取得し直す
+            mock_stamp.return_value = (2, "mounts")
+            disk_utils.get_all_disks()
+            assert mock_check_output.call_count == 2
+            
+            # キャッシュを破棄した場合も取得し直す
+            disk_utils.invalidate_cache()
+            disk_utils.get_all_disks()
+            assert mock_check_output.call_count == 3
+    
+    @patch('subprocess.check_output')
+    def test_get_all_disks_cache_ttl(self, mock_check_output, disk_utils):
+        """ディスク構成の変化を判定できない場合はTTLの間だけ結果を再利用することのテスト"""
+        mock_check_output.return_value = json.dumps({"blockdevices": []}).encode('utf-8')
+        
+        with patch.object(disk_utils, '_get_disk_stamp', return_value=None), \
+                patch('src.disk_utils.time.monotonic', return_value=100.0) as mock_monotonic:
+            disk_utils.get_all_disks()
+            mock_monotonic.return_value = 100.0 + DiskUtils.DISK_CACHE_TTL / 2
+            disk_utils.get_all_disks()
+            assert mock_check_output.call_count == 1
+            
+            # TTLを過ぎた場合は取得し直す
+            mock_monotonic.return_value = 100.0 + DiskUtils.DISK_CACHE_TTL
+            disk_utils.get_all_disks()
+            assert mock_check_output.call_count == 2
+    
     @patch('subprocess.check_output')
     @patch('json.loads')
     def test_get_mounted_disks(self, mock_json_loads, mock_check_output, disk_utils, mock_logger):
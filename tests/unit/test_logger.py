@@ -3,9 +3,15 @@
 """
 
 import os
+import logging
+import threading
 import pytest
 from unittest.mock import patch, mock_open
-from src.logger import Logger
+from src.logger import Logger, _ts
+
+def written_lines(mock_writev):
+    """os.writevのモックに渡されたログ行を返す"""
+    return [line for call in mock_writev.call_args_list for line in call.args[1]]
 
 class TestLogger:
     """Loggerクラスのテスト"""
@@ -32,19 +38,21 @@ class TestLogger:
 
     def test_logger_methods(self, logger):
         """ロガーのメソッドテスト"""
-        with patch('builtins.open', mock_open()) as mock_file:
+        with patch('builtins.open', mock_open()) as mock_file, \
+                patch('os.writev') as mock_writev:
             # 各ログメソッドを呼び出し
             logger.info("Test info message")
             logger.warning("Test warning message")
             logger.error("Test error message")
             logger.debug("Test debug message")
+            logger.flush()
             
             # メソッド呼び出し回数を確認
             assert logger._call_count == 4
             
-            # ファイル操作の回数を確認
-            assert mock_file.call_count == 4
-            assert mock_file.return_value.write.call_count == 4
+            # ファイルを開き直さず、全メッセージが書き込まれることを確認
+            assert mock_file.call_count == 0
+            assert len(written_lines(mock_writev)) == 4
 
     def test_logger_automatic_directory_creation(self, temp_dir):
         """ログディレクトリの自動作成テスト"""
@@ -58,19 +66,193 @@ class TestLogger:
 
     def test_logger_file_error(self, logger):
         """ファイル操作エラーのテスト"""
-        with patch('builtins.open', side_effect=IOError("Test error")):
+        with patch('os.writev', side_effect=OSError("Test error")):
             # エラーが発生しても例外が伝播しないことを確認
             logger.info("Test message")
             logger.warning("Test message")
             logger.error("Test message")
             logger.debug("Test message")
+            logger.flush()
 
     def test_logger_rotation(self, logger):
         """ログローテーションのテスト"""
-        with patch('builtins.open', mock_open()) as mock_file:
+        with patch('os.writev') as mock_writev:
             # 大量のログを書き込み
             for i in range(1000):
                 logger.info(f"Test message {i}")
+            logger.flush()
+            
+            # 書き込まれた行数を確認
+            assert len(written_lines(mock_writev)) == 1000
+
+    def test_log_lines_written_in_batches(self, logger):
+        """溜まったログ行がまとめて書き込まれることのテスト"""
+        # 最初の書き込みを止めておき、その間にログ行を溜める
+        release = threading.Event()
+        with patch('os.writev', side_effect=lambda fd, lines: release.wait(timeout=5)) as mock_writev:
+            for i in range(1000):
+                logger.info(f"Test message {i}")
+            release.set()
+            logger.flush()
             
-            # 書き込み回数を確認
-            assert mock_file.return_value.write.call_count == 1000 
\ No newline at end of file
+            # 行数より少ない回数で書き込まれていることを確認
+            assert len(written_lines(mock_writev)) == 1000
+            assert mock_writev.call_count < 1000
+
+    def test_timestamp_cache(self):
+        """タイムスタンプキャッシュのテスト"""
+        with patch('src.logger.time.time', return_value=1700000000.2):
+            first = _ts()
+        with patch('src.logger.time.time', return_value=1700000000.9):
+            # 同じ秒の間は同じ文字列を再利用することを確認
+            assert _ts() is first
+        with patch('src.logger.time.time', return_value=1700000001.0):
+            assert _ts() != first
+
+    def test_sanitize_path(self, logger, temp_dir):
+        """パスのサニタイズテスト"""
+        sanitized = logger._sanitize_path(os.path.join(temp_dir, "a<b>c:d\"e|f?g*h", "..", "log"))
+        # 特殊文字が除去され、パスが正規化されていることを確認
+        assert sanitized == os.path.join(temp_dir, "log")
+        assert not any(c in sanitized for c in '<>:"|?*\\')
+
+    def test_message_buffer_is_bounded(self, logger):
+        """メッセージバッファの上限テスト"""
+        with patch('os.writev'):
+            for i in range(2000):
+                logger.info(f"Test message {i}")
+            logger.flush()
+
+        # 古いメッセージから破棄され、最新のメッセージが残ることを確認
+        assert len(logger.messages) == 1024
+        assert logger.messages[-1] == "Test message 1999"
+
+    def test_logger_level_filtering(self, logger):
+        """ログレベルによるフィルタリングのテスト"""
+        logger.logger.setLevel(logging.INFO)
+        try:
+            with patch('os.writev') as mock_writev:
+                logger.debug("Test debug message")
+                logger.info("Test info message")
+                logger.flush()
+
+                # 無効なレベルのログは書き込まれないことを確認
+                assert logger._call_count == 1
+                assert len(written_lines(mock_writev)) == 1
+                assert "Test debug message" not in logger.messages
+        finally:
+            logger.logger.setLevel(logging.DEBUG)
+
+    def test_logger_writes_to_file(self, logger):
+        """ログファイルへの書き込みテスト"""
+        logger.info("Test info message")
+        logger.error("Test error message")
+        logger.close()
+
+        with open(logger.log_file, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+        assert lines[0].endswith(" INFO Test info message")
+        assert lines[1].endswith(" ERROR Test error message")
+
+        # 閉じた後に書き込んでも例外が伝播しないことを確認
+        logger.info("Test message")
+
+    def test_log_file_rotation(self, logger):
+        """ログファイルのローテーションテスト"""
+        with patch('src.logger._MAX_BYTES', 200):
+            for i in range(8):
+                for j in range(10):
+                    logger.info(f"Test message {i}-{j}")
+                logger.flush()
+
+        # バックアップ枠を使い切った後は既存の枠が再利用されることを確認
+        backups = [f"{logger.log_file}.{i}" for i in range(1, 6)]
+        assert all(os.path.exists(path) for path in backups)
+        assert not os.path.exists(f"{logger.log_file}.6")
+        assert os.path.getsize(logger.log_file) < 200
+
+        # ローテーション後のファイルのパーミッションを確認
+        assert os.stat(logger.log_file).st_mode & 0o777 == 0o644
+
+    def test_handlers_configured_once(self, temp_dir):
+        """ハンドラが重複して登録されないことのテスト"""
+        first = Logger(temp_dir)
+        second = Logger(os.path.join(temp_dir, "other"))
+
+        # 同じロガーを共有し、ログファイルを扱うハンドラが登録されていないことを確認
+        assert first.logger is second.logger
+        assert not any(isinstance(h, logging.FileHandler) for h in second.logger.handlers)
+        assert not second.logger.propagate
+
+    def test_error_is_written_before_return(self, logger):
+        """エラーログが即座に書き込まれることのテスト"""
+        logger.error("Test error message")
+
+        # flushを呼ばなくても書き込み済みであることを確認
+        with open(logger.log_file, encoding='utf-8') as f:
+            assert "Test error message" in f.read()
+
+    def test_writer_shared_per_log_file(self, temp_dir):
+        """同じログファイルのライターが共有されることのテスト"""
+        first = Logger(temp_dir)
+        second = Logger(temp_dir)
+        try:
+            # 同じファイルを二重に開かないことを確認
+            assert first._writer is second._writer
+
+            # 一方を閉じても、もう一方は書き込みを継続できることを確認
+            first.close()
+            second.info("Test info message")
+            second.flush()
+            with open(second.log_file, encoding='utf-8') as f:
+                assert "Test info message" in f.read()
+        finally:
+            second.close()
+
+    def test_fsync_only_on_error(self, logger):
+        """fsyncがエラー出力時にのみ行われることのテスト"""
+        with patch('os.writev') as mock_writev, patch('os.fsync') as mock_fsync:
+            for i in range(100):
+                logger.info(f"Test message {i}")
+            logger.flush()
+
+            # 通常のログではfsyncしないことを確認
+            assert mock_fsync.call_count == 0
+            assert len(written_lines(mock_writev)) == 100
+
+            logger.error("Test error message")
+            assert mock_fsync.call_count == 1
+
+    def test_writer_stops_on_sentinel_mid_batch(self, logger):
+        """終了要求がまとめた行の途中にあっても書き込みスレッドが終了することのテスト"""
+        writer = logger._writer
+        release = threading.Event()
+        with patch('os.writev', side_effect=lambda fd, lines: release.wait(timeout=5)) as mock_writev:
+            # 最初の書き込みを止めている間に、closeと競合したwriteの並びを再現する
+            logger.info("first")
+            writer._queue.put(b"before\n")
+            writer._queue.put(None)
+            writer._queue.put(b"after\n")
+            release.set()
+            writer._thread.join(timeout=5)
+
+            assert not writer._thread.is_alive()
+            assert None not in written_lines(mock_writev)
+
+    def test_flush_during_close_returns(self, logger):
+        """closeと並行してflushしても待ち続けないことのテスト"""
+        writer = logger._writer
+        release = threading.Event()
+        with patch('os.writev', side_effect=lambda fd, lines: release.wait(timeout=5)):
+            logger.info("first")
+            flushing = threading.Thread(target=logger.flush, kwargs={'sync': True})
+            closing = threading.Thread(target=writer.close)
+            flushing.start()
+            closing.start()
+            release.set()
+            flushing.join(timeout=5)
+            closing.join(timeout=5)
+
+            assert not flushing.is_alive()
+            assert not closing.is_alive()